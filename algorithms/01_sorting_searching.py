@@ -29,6 +29,19 @@ people.sort(key=lambda x: x[1])              # sort by age
 people.sort(key=lambda x: (x[1], x[0]))      # sort by age, then name
 people.sort(key=lambda x: x[1], reverse=True)# sort by age descending
 
+# multi-key without a tuple per element: two stable passes,
+# secondary key first, primary key last (itemgetter runs in C)
+from operator import itemgetter
+people.sort(key=itemgetter(0))               # by name
+people.sort(key=itemgetter(1))               # then by age, names stay ordered
+
+# SoA layout: keep each field in its own list, sort an index permutation
+names = [p[0] for p in people]
+ages = [p[1] for p in people]
+order = sorted(range(len(people)), key=names.__getitem__)
+order.sort(key=ages.__getitem__)             # same two-pass trick on indices
+sorted_people = [people[i] for i in order]   # only convert back if you need rows
+
 # sort a dictionary by value
 d = {'a': 3, 'b': 1}
 sorted_items = sorted(d.items(), key=lambda x: x[1])  # [('b', 1), ('a', 3)]
@@ -48,15 +61,26 @@ sorted_items = sorted(d.items(), key=lambda x: x[1])  # [('b', 1), ('a', 3)]
 def binary_search(nums, target):
     left, right = 0, len(nums) - 1   # define the search space [left, right]
     while left <= right:
-        mid = (left + right) // 2    # compute midpoint
-        if nums[mid] == target:      # found it
+        mid = left + ((right - left) >> 1)  # midpoint via shift (no overflow in fixed-width langs)
+        val = nums[mid]              # index once, reuse for both compares
+        if val == target:            # found it
             return mid
-        elif nums[mid] < target:     # target in right half
+        elif val < target:           # target in right half
             left = mid + 1
         else:                        # target in left half
             right = mid - 1
     return -1                        # not found
 
+# many lookups at once: the searches run in C via bisect, driven by map()
+# returns the index of each target, or -1 where it's missing
+def binary_search_many(nums, targets):
+    from bisect import bisect_left
+    from itertools import repeat
+    targets = list(targets)
+    n = len(nums)
+    idx = map(bisect_left, repeat(nums, len(targets)), targets)
+    return [i if i < n and nums[i] == t else -1 for i, t in zip(idx, targets)]
+
 # ------------------------
 # 🔢 LOWER / UPPER BOUND
 # ------------------------
@@ -65,7 +89,7 @@ def binary_search(nums, target):
 def lower_bound(nums, target):
     left, right = 0, len(nums)
     while left < right:
-        mid = (left + right) // 2
+        mid = left + ((right - left) >> 1)
         if nums[mid] < target:       # move right if too small
             left = mid + 1
         else:                        # possible match, go left
@@ -76,26 +100,70 @@ def lower_bound(nums, target):
 def upper_bound(nums, target):
     left, right = 0, len(nums)
     while left < right:
-        mid = (left + right) // 2
+        mid = left + ((right - left) >> 1)
         if nums[mid] <= target:      # not strictly greater → move right
             left = mid + 1
         else:
             right = mid
     return left                      # returns len(nums) if target ≥ all elements
 
+# ------------------------
+# 🔀 BRANCHLESS BOUNDS
+# ------------------------
+
+# same result as lower_bound, but the loop runs a fixed ⌈log2 n⌉ times
+# and the compare feeds arithmetic instead of choosing a branch
+def lower_bound_branchless(nums, target):
+    n = len(nums)
+    if n == 0:
+        return 0
+    base = 0
+    while n > 1:
+        half = n >> 1
+        base += half * (nums[base + half] < target)  # bool → 0/1, no if/else
+        n -= half                    # window shrinks the same way every step
+    return base + (nums[base] < target)
+
+# same result as upper_bound (<= instead of <)
+def upper_bound_branchless(nums, target):
+    n = len(nums)
+    if n == 0:
+        return 0
+    base = 0
+    while n > 1:
+        half = n >> 1
+        base += half * (nums[base + half] <= target)
+        n -= half
+    return base + (nums[base] <= target)
+
 # ------------------------
 # 📈 MERGE SORT (RECURSIVE)
 # ------------------------
 
+RUN = 32                             # below this size insertion sort beats recursing
+
 # stable sort using divide and conquer
+# recursion passes (lo, hi) bounds into one buffer → no slice copies per call
 def merge_sort(arr):
-    if len(arr) <= 1:
-        return arr                   # base case: already sorted
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])    # recursively sort left
-    right = merge_sort(arr[mid:])   # recursively sort right
-    return merge(left, right)       # merge sorted halves
-
+    buf = list(arr)                  # single copy, caller's list untouched
+    aux = [None] * len(buf)          # scratch space shared by every merge
+    _merge_sort_range(buf, aux, 0, len(buf))
+    return buf
+
+# sort a[lo:hi] in place
+def _merge_sort_range(a, aux, lo, hi):
+    if hi - lo <= RUN:
+        _insertion_sort(a, lo, hi)   # base case: small tile sorted in place
+        return
+    mid = (lo + hi) // 2
+    _merge_sort_range(a, aux, lo, mid)   # recursively sort left
+    _merge_sort_range(a, aux, mid, hi)   # recursively sort right
+    if a[mid - 1] <= a[mid]:
+        return                       # halves already in order → nothing to merge
+    _merge_into(a, aux, lo, mid, hi) # merge sorted halves into aux
+    a[lo:hi] = aux[lo:hi]            # copy back in one C-level slice assignment
+
+# merge two separate sorted lists into a new list
 def merge(left, right):
     result = []
     i = j = 0
@@ -110,19 +178,90 @@ def merge(left, right):
     result.extend(right[j:])
     return result
 
+# stable in-place insertion sort of arr[lo:hi] (cache-hot for small tiles)
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi):
+        val = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > val:  # strict > keeps equal items in order
+            arr[j + 1] = arr[j]      # shift larger items right
+            j -= 1
+        arr[j + 1] = val
+
+# ------------------------
+# 📈 MERGE SORT (BOTTOM-UP, BUFFER REUSE)
+# ------------------------
+
+# iterative merge sort: merge runs of width 1, 2, 4, ... between two
+# preallocated buffers and swap them after each pass (no per-merge lists)
+def merge_sort_bottom_up(arr):
+    n = len(arr)
+    src = list(arr)                  # copy once, caller's list untouched
+    dst = [None] * n                 # second buffer, reused every pass
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src          # ping-pong: output becomes next input
+        width *= 2
+    return src
+
+# merge src[lo:mid] and src[mid:hi] into dst[lo:hi]
+def _merge_into(src, dst, lo, mid, hi):
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if i < mid and (j >= hi or src[i] <= src[j]):  # <= keeps it stable
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+
+# ------------------------
+# 🧵 MERGE SORT (PARALLEL, MULTIPROCESSING)
+# ------------------------
+
+# split into `procs` chunks, sort each in a worker process, k-way merge here
+# processes (not threads) → each worker has its own GIL, so the sorts really run in parallel
+def parallel_merge_sort(arr, procs=None):
+    import heapq
+    import os
+    from multiprocessing import Pool
+
+    procs = procs or os.cpu_count() or 1
+    if procs == 1 or len(arr) < 2 * procs:
+        return sorted(arr)           # not worth the process startup cost
+
+    size = -(-len(arr) // procs)     # ceil division → at most `procs` chunks
+    chunks = [arr[i:i + size] for i in range(0, len(arr), size)]
+    with Pool(procs) as pool:
+        sorted_chunks = pool.map(sorted, chunks)  # chunks are pickled to workers
+    return list(heapq.merge(*sorted_chunks))      # serial O(n log procs) merge
+
 # ------------------------
 # ⚡ QUICK SORT (IN-PLACE)
 # ------------------------
 
-# unstable in-place quicksort (uses last element as pivot)
+SMALL = 16                           # subranges this short go to insertion sort
+
+# unstable in-place introsort: quicksort with median-of-three pivot,
+# heap sort once recursion gets too deep, insertion sort for tiny ranges
 def quick_sort(arr):
-    def sort(low, high):
-        if low < high:
-            p = partition(arr, low, high)  # pivot index
-            sort(low, p - 1)               # left part
-            sort(p + 1, high)              # right part
+    def sort(low, high, depth):
+        if high - low + 1 <= SMALL:
+            _insertion_sort(arr, low, high + 1)   # tiny range: no more splitting
+            return
+        if depth == 0:
+            _heap_sort_range(arr, low, high)      # bad pivots → bail out, O(n log n)
+            return
+        p = partition(arr, low, high)  # pivot index
+        sort(low, p - 1, depth - 1)    # left part
+        sort(p + 1, high, depth - 1)   # right part
 
     def partition(arr, low, high):
+        _median3(arr, low, (low + high) // 2, high)  # median of 3 → arr[high]
         pivot = arr[high]
         i = low
         for j in range(low, high):
@@ -132,15 +271,36 @@ def quick_sort(arr):
         arr[i], arr[high] = arr[high], arr[i]    # place pivot
         return i
 
-    sort(0, len(arr) - 1)
+    if len(arr) > 1:
+        sort(0, len(arr) - 1, 2 * (len(arr).bit_length() - 1))  # depth limit ≈ 2·log2(n)
+
+# order arr[a], arr[b], arr[c], then park the median at arr[c] (the pivot slot)
+def _median3(arr, a, b, c):
+    if arr[b] < arr[a]:
+        arr[a], arr[b] = arr[b], arr[a]
+    if arr[c] < arr[a]:
+        arr[a], arr[c] = arr[c], arr[a]
+    if arr[c] < arr[b]:
+        arr[b], arr[c] = arr[c], arr[b]
+    arr[b], arr[c] = arr[c], arr[b]          # median now at arr[c]
+
+# heap sort arr[low..high] (inclusive) using the C-backed heapq
+def _heap_sort_range(arr, low, high):
+    import heapq
+    heap = arr[low:high + 1]
+    heapq.heapify(heap)
+    arr[low:high + 1] = [heapq.heappop(heap) for _ in range(len(heap))]
 
 # ------------------------
 # 🧮 COMMON PATTERNS
 # ------------------------
 
 # check if list is sorted
+# map(le, ...) compares neighbours in C; all() still stops at the first drop
 def is_sorted(arr):
-    return all(arr[i] <= arr[i+1] for i in range(len(arr)-1))
+    from itertools import islice
+    from operator import le
+    return all(map(le, arr, islice(arr, 1, None)))
 
 # binary search on answer (monotonic function)
 def min_satisfying_val(nums, check):
@@ -195,8 +355,11 @@ sorted_d = sorted(d.items(), key=lambda x: x[1])
 # ❌ list.sort() returns None → use sorted() if you want a new list
 # ❌ binary search only works on sorted input
 # ❌ merge sort is O(n) space
-# ❌ quick sort is O(n^2) worst-case if input is already sorted
+# ❌ recursing down to length-1 lists wastes calls → cut off at RUN and insertion sort
+# ❌ quick sort is O(n^2) worst-case if input is already sorted (last-element pivot)
+#    → median-of-three + heap sort fallback (introsort) caps it at O(n log n)
 # ❌ off-by-one bugs common in lower/upper bounds
+# ❌ (left + right) // 2 overflows in C/Java → use left + ((right - left) >> 1)
 # ❌ upper_bound may return len(arr) → must check before access
 
 # ------------------------
@@ -208,6 +371,7 @@ sorted_d = sorted(d.items(), key=lambda x: x[1])
 # - must sort by multiple keys or values
 # - need a fast in-place sort → quick sort
 # - need stable sort → merge or Python’s built-in
+# - huge input + many cores → parallel merge sort (chunk, sort in workers, merge)
 
 # ------------------------
 # ⏱ TIME COMPLEXITY
@@ -215,6 +379,10 @@ sorted_d = sorted(d.items(), key=lambda x: x[1])
 
 # sorted() / sort():      O(n log n)
 # binary search:          O(log n)
+# binary_search_many:     O(m log n) for m targets, loop in C
 # merge sort:             O(n log n), stable, O(n) space
-# quick sort:             O(n log n) avg, O(n^2) worst, in-place
+# bottom-up merge sort:   O(n log n), stable, 2 buffers total
+# parallel merge sort:    O(n log n / p) sort + O(n log p) merge, p processes
+# quick sort (introsort):  O(n log n) avg and worst, in-place
 # bisect:                 O(log n)
+# branchless bounds:      O(log n), fixed trip count (no early exit)
@@ -30,6 +30,17 @@ def has_pair_with_sum(arr, target):
             right -= 1                  # decrease sum by moving right pointer
     return False                        # no such pair found
 
+# Same question, no sort: one pass remembering values seen so far
+# O(n) time / O(n) space vs sort + two pointers: O(n log n) time / O(1) extra
+# (keep the sorted version when the caller reuses the sorted array)
+def has_pair_with_sum_hash(arr, target):
+    seen = set()
+    for x in arr:
+        if target - x in seen:          # complement appeared earlier
+            return True
+        seen.add(x)
+    return False
+
 # Max area between two vertical lines (Leetcode #11)
 def max_area(height):
     left, right = 0, len(height) - 1
@@ -44,8 +55,12 @@ def max_area(height):
             right -= 1
     return max_area
 
-# Palindrome check
+# Palindrome check: reversed copy + one C-level compare (memcmp speed)
 def is_palindrome(s):
+    return s == s[::-1]                 # works for str, bytes, and lists
+
+# Palindrome check, two-pointer form: O(1) space, exits on first mismatch
+def is_palindrome_early_exit(s):
     left, right = 0, len(s) - 1
     while left < right:
         if s[left] != s[right]:
@@ -59,26 +74,28 @@ def is_palindrome(s):
 # ------------------------
 
 # Remove duplicates from sorted array (in-place)
+# works on list or array.array('q') (packed int64, no PyObject per slot)
 def remove_duplicates(nums):
     if not nums:
         return 0
     slow = 0
-    for fast in range(1, len(nums)):
-        if nums[fast] != nums[slow]:     # found new unique value
+    last = nums[0]                       # value at nums[slow], kept in a local
+    for x in nums:                       # fast pointer = the iterator itself
+        if x != last:                    # found new unique value
             slow += 1
-            nums[slow] = nums[fast]      # overwrite duplicate
+            nums[slow] = x               # overwrite duplicate (slow ≤ fast, safe)
+            last = x
     return slow + 1
 
 # Overwrite zero values in-place (3-pointer: slow, fast, scanner)
 def remove_zeros(nums):
     slow = 0
-    for fast in range(len(nums)):
-        if nums[fast] != 0:              # copy only non-zero
-            nums[slow] = nums[fast]
+    for x in nums:                       # fast pointer = the iterator itself
+        if x != 0:                       # copy only non-zero
+            nums[slow] = x
             slow += 1
-    while slow < len(nums):              # fill remaining with zeros
-        nums[slow] = 0
-        slow += 1
+    for i in range(slow, len(nums)):     # fill remaining with zeros
+        nums[i] = 0
 
 # ------------------------
 # 3️⃣ SLIDING WINDOW (FIXED + VARIABLE)
@@ -86,12 +103,12 @@ def remove_zeros(nums):
 
 # Fixed-size window: max sum of k-length subarray
 def max_subarray_sum_k(nums, k):
-    window = sum(nums[:k])              # first window sum
-    max_sum = window
-    for i in range(k, len(nums)):
-        window += nums[i] - nums[i - k] # slide window: add new, drop oldest
-        max_sum = max(max_sum, window)
-    return max_sum
+    from itertools import accumulate
+    from operator import sub
+    if len(nums) < k:
+        return None                     # not enough elements
+    prefix = list(accumulate(nums, initial=0))  # prefix[i] = sum(nums[:i])
+    return max(map(sub, prefix[k:], prefix))    # window sum = prefix[i+k] - prefix[i], loop runs in C
 
 # Variable-size window: min subarray length with sum ≥ target
 def min_subarray_len(target, nums):
@@ -105,42 +122,72 @@ def min_subarray_len(target, nums):
             left += 1
     return res if res != float('inf') else 0
 
+# Same, prefix sums + bisect (positive nums only → prefix strictly increasing)
+def min_subarray_len_prefix(target, nums):
+    from bisect import bisect_left
+    from itertools import accumulate
+    n = len(nums)
+    prefix = list(accumulate(nums, initial=0))
+    res = n + 1
+    for i in range(n):
+        j = bisect_left(prefix, prefix[i] + target, i + 1)  # first end reaching target
+        if j <= n:
+            res = min(res, j - i)
+    return res if res <= n else 0
+
 # ------------------------
 # 4️⃣ STRINGS (COMPRESSION / WINDOW)
 # ------------------------
 
 # Compress repeating characters: 'aaabbc' → 'a3b2c1'
 def compress(s):
+    from itertools import groupby
+    # groupby finds each run in C; only the per-run formatting is Python
+    return ''.join(c + str(sum(1 for _ in run)) for c, run in groupby(s))
+
+# Same output, explicit two-pointer scan (run = s[i:j])
+def compress_two_pointer(s):
     i = 0
     res = []
     while i < len(s):
-        count = 1
-        while i + 1 < len(s) and s[i] == s[i + 1]:
-            count += 1
-            i += 1
-        res.append(s[i] + str(count))   # append char + count
-        i += 1
+        j = i + 1
+        while j < len(s) and s[j] == s[i]:
+            j += 1                      # extend run
+        res.append(s[i] + str(j - i))   # append char + count
+        i = j
     return ''.join(res)
 
 # Check if s contains an anagram of t
+# diff[c] = window count - t count; `off` = how many chars have diff != 0
 def has_anagram(s, t):
-    from collections import Counter
     if len(t) > len(s): return False
+    if not t: return True
+    k = len(t)
+
+    if s.isascii() and t.isascii():
+        s, t = s.encode(), t.encode()   # bytes → s[i] is an int 0..127
+        diff = [0] * 128                # flat table indexed by code
+    else:
+        from collections import defaultdict
+        diff = defaultdict(int)         # other code points: keyed by char
+    for c in t:
+        diff[c] -= 1
+    for c in s[:k]:
+        diff[c] += 1
+    off = sum(1 for c in {*t, *s[:k]} if diff[c])
 
-    t_count = Counter(t)
-    window = Counter(s[:len(t)])
-    
-    if window == t_count:
-        return True
-
-    for i in range(len(t), len(s)):
-        window[s[i]] += 1
-        window[s[i - len(t)]] -= 1
-        if window[s[i - len(t)]] == 0:
-            del window[s[i - len(t)]]
-        if window == t_count:
+    for i in range(k, len(s)):
+        if off == 0:
             return True
-    return False
+        a = s[i]                        # char entering the window
+        diff[a] += 1
+        if diff[a] == 0: off -= 1
+        elif diff[a] == 1: off += 1
+        r = s[i - k]                    # char leaving the window
+        diff[r] -= 1
+        if diff[r] == 0: off -= 1
+        elif diff[r] == -1: off += 1
+    return off == 0
 
 # ------------------------
 # 🧮 COMMON PATTERNS
@@ -207,6 +254,17 @@ for i, val in enumerate(a):
 # slicing in reverse
 print(a[::-1])  # reversed list
 
+# array.array for big int inputs: same indexing, values packed contiguously
+from array import array
+nums = array('q', [0, 1, 1, 0, 2])      # 'q' = signed 64-bit
+remove_zeros(nums)                      # in-place helpers above work unchanged
+
+# already-compiled (C) equivalents of the helpers above — use outside interviews
+a.reverse()                             # reverse_array, in place
+merged = sorted(a + b)                  # merge_sorted: Timsort spots the 2 runs → linear merge
+is_pal = a == a[::-1]                   # is_palindrome
+dedup = list(dict.fromkeys(a))          # skip_duplicates without the sort (keeps first-seen order)
+
 # ------------------------
 # 🧵 WHEN TO USE
 # ------------------------
@@ -222,6 +280,7 @@ print(a[::-1])  # reversed list
 # ------------------------
 
 # dual-pointer scan:         O(n)
+# pair sum via hash set:     O(n) time, O(n) space (no sort needed)
 # fixed sliding window:      O(n)
 # variable window:           O(n) avg
 # merge sorted arrays:       O(n + m)
@@ -18,29 +18,24 @@
 
 # max sum of any subarray of size k
 def max_subarray_sum_k(nums, k):
+    from itertools import accumulate
+    from operator import sub
+
     if len(nums) < k:
         return None                        # not enough elements
 
-    window_sum = sum(nums[:k])            # sum of first window
-    max_sum = window_sum
-
-    for i in range(k, len(nums)):
-        window_sum += nums[i] - nums[i - k]  # add right, drop left
-        max_sum = max(max_sum, window_sum)
+    prefix = list(accumulate(nums, initial=0))  # prefix[i] = sum(nums[:i])
 
-    return max_sum
+    # every window sum at once: prefix[i+k] - prefix[i] (map/max loop in C)
+    return max(map(sub, prefix[k:], prefix))
 
 # running average of all k-length subarrays
 def average_subarrays(nums, k):
-    res = []
-    window_sum = sum(nums[:k])
-    res.append(window_sum / k)
+    from itertools import accumulate
+    from operator import sub
 
-    for i in range(k, len(nums)):
-        window_sum += nums[i] - nums[i - k]
-        res.append(window_sum / k)
-
-    return res
+    prefix = list(accumulate(nums, initial=0))
+    return [w / k for w in map(sub, prefix[k:], prefix)]
 
 # ------------------------
 # 2️⃣ VARIABLE-SIZE WINDOW
@@ -63,20 +58,50 @@ def min_subarray_len(target, nums):
     # no valid subarray found
     return min_len if min_len != float('inf') else 0
 
+# same answer via prefix sums + binary search — positive nums ONLY
+# (prefix sums must be strictly increasing; with negatives use the window above)
+def min_subarray_len_prefix(target, nums):
+    from bisect import bisect_left
+    from itertools import accumulate
+
+    n = len(nums)
+    prefix = list(accumulate(nums, initial=0))   # built in C
+    min_len = n + 1
+
+    for i in range(n):
+        # first end j with prefix[j] - prefix[i] >= target (search runs in C)
+        j = bisect_left(prefix, prefix[i] + target, i + 1)
+        if j <= n and j - i < min_len:
+            min_len = j - i
+
+    return min_len if min_len <= n else 0
+
 # longest substring with ≤ k distinct characters
 def longest_k_distinct(s, k):
-    from collections import defaultdict
-    freq = defaultdict(int)
+    if not s:
+        return 0
+
+    if s.isascii():
+        codes = s.encode()               # bytes → ints 0..127, 1 byte per char
+        freq = [0] * 128                 # flat count table, indexed by code
+    else:
+        from collections import defaultdict
+        codes = s                        # any code point → count by char instead
+        freq = defaultdict(int)
+    distinct = 0                         # number of nonzero entries in freq
     left = 0
     max_len = 0
 
-    for right in range(len(s)):
-        freq[s[right]] += 1              # add char to window
+    for right, c in enumerate(codes):
+        if freq[c] == 0:
+            distinct += 1
+        freq[c] += 1                     # add char to window
 
-        while len(freq) > k:             # too many distinct → shrink
-            freq[s[left]] -= 1
-            if freq[s[left]] == 0:
-                del freq[s[left]]        # remove empty keys
+        while distinct > k:              # too many distinct → shrink
+            d = codes[left]
+            freq[d] -= 1
+            if freq[d] == 0:
+                distinct -= 1            # char fully left the window
             left += 1
 
         max_len = max(max_len, right - left + 1)
@@ -89,28 +114,45 @@ def longest_k_distinct(s, k):
 
 # check if s contains any permutation of t
 def contains_permutation(s, t):
-    from collections import Counter
-
     if len(t) > len(s):
         return False                    # impossible if t longer
+    if not t:
+        return True                     # empty pattern matches anywhere
+
+    k = len(t)
+    if s.isascii() and t.isascii():
+        s, t = s.encode(), t.encode()   # bytes → s[i] is an int 0..127
+        diff = [0] * 128                # diff[c] = window count - t count
+    else:
+        from collections import defaultdict
+        diff = defaultdict(int)         # other code points: keyed by char
+
+    for c in t:
+        diff[c] -= 1                    # target pattern count
+    for c in s[:k]:
+        diff[c] += 1                    # initial window
+
+    off = sum(1 for c in {*t, *s[:k]} if diff[c])  # chars whose counts still differ
+
+    for i in range(k, len(s)):
+        if off == 0:
+            return True                 # match found
 
-    t_count = Counter(t)                # target pattern count
-    window = Counter(s[:len(t)])        # initial window
-
-    if window == t_count:
-        return True
-
-    for i in range(len(t), len(s)):
-        window[s[i]] += 1               # add new char to right
-        window[s[i - len(t)]] -= 1      # remove old char from left
-
-        if window[s[i - len(t)]] == 0:
-            del window[s[i - len(t)]]   # remove zero-count entries
+        add = s[i]                      # add new char to right
+        diff[add] += 1
+        if diff[add] == 0:
+            off -= 1                    # this char now matches
+        elif diff[add] == 1:
+            off += 1                    # this char just started to differ
 
-        if window == t_count:
-            return True                 # match found
+        drop = s[i - k]                 # remove old char from left
+        diff[drop] -= 1
+        if diff[drop] == 0:
+            off -= 1
+        elif diff[drop] == -1:
+            off += 1
 
-    return False                        # no match
+    return off == 0                     # last window decides
 
 # ------------------------
 # 4️⃣ UNIQUE ELEMENT TRACKING
@@ -118,17 +160,25 @@ def contains_permutation(s, t):
 
 # longest substring with no repeats
 def longest_unique_substring(s):
-    seen = set()
+    if not s:
+        return 0
+
+    if s.isascii():
+        last = [-1] * 128              # last index each char was seen at
+        chars = s.encode()             # bytes → ints 0..127
+    else:
+        from collections import defaultdict
+        last = defaultdict(lambda: -1) # same, keyed by char for other code points
+        chars = s
     left = 0
     max_len = 0
 
-    for right in range(len(s)):
-        while s[right] in seen:
-            seen.remove(s[left])       # shrink until char removed
-            left += 1
-
-        seen.add(s[right])             # add current char
-        max_len = max(max_len, right - left + 1)
+    for right, c in enumerate(chars):
+        if last[c] >= left:
+            left = last[c] + 1         # jump past the repeat in one step
+        last[c] = right
+        if right - left + 1 > max_len:
+            max_len = right - left + 1
 
     return max_len
 
@@ -179,12 +229,42 @@ def max_sliding_window(nums, k):
 
     return res
 
+# same deque laid out in a preallocated list: dq[head:tail] is the live part
+# popleft → head += 1, pop → tail -= 1 (each index pushed at most once → n slots)
+def max_sliding_window_buffer(nums, k):
+    n = len(nums)
+    if n < k:
+        return []
+    dq = [0] * n
+    head = tail = 0
+    res = [0] * (n - k + 1)             # one max per window, filled by index
+
+    for i in range(n):
+        val = nums[i]
+        if head < tail and dq[head] <= i - k:
+            head += 1                  # at most one index leaves per step
+
+        while head < tail and nums[dq[tail - 1]] < val:
+            tail -= 1
+
+        dq[tail] = i
+        tail += 1
+
+        if i >= k - 1:
+            res[i - k + 1] = nums[dq[head]]
+
+    return res
+
+# ⚠️ no faster than the deque in CPython (cursor math costs what the method calls did);
+# the flat int buffer only pays off once the loop is compiled (numba / C)
+
 # ------------------------
 # ⚠️ GOTCHAS
 # ------------------------
 
 # ❌ must shrink window properly or logic will break
 # ❌ always remove zero-counts from counter/dict to avoid false mismatch
+# ❌ comparing whole counters every step is O(alphabet) → track a mismatch count instead
 # ❌ fixed-size logic won't work on variable-size questions
 # ❌ skip monotonic queue unless asked for max/min in window
 # ❌ don't assume condition will *ever* be met (handle empty case)
@@ -225,7 +305,9 @@ if window == target:
 # ------------------------
 
 # fixed window sum:               O(n)
+# prefix-sum window trick:        O(n) time, O(n) space
 # variable window shrink/expand:  O(n)
+# prefix sum + bisect variant:    O(n log n), positive values only
 # freq map maintenance:           O(k) space
 # monotonic deque:                O(n)
 # nested-at-most trick:           O(n) twice
@@ -93,6 +93,7 @@ print(freq["a"])                     # → 3
 
 # top-k frequent
 print(freq.most_common(2))           # [('a', 3), ('n', 2)]
+# most_common(k) uses a size-k heap (O(n log k)); most_common() sorts everything
 
 # subtract counters
 c1 = Counter("abbc")
@@ -132,8 +133,22 @@ original = {'a': 1, 'b': 2}
 inverse = {v: k for k, v in original.items()}
 
 # 5. anagram check
+# ASCII: one fixed 128-slot count table (+1 for s, -1 for t) instead of two Counters
 def is_anagram(s, t):
-    return Counter(s) == Counter(t)
+    if len(s) != len(t):
+        return False                 # O(1) reject before counting anything
+    if not (s.isascii() and t.isascii()):
+        return Counter(s) == Counter(t)  # any code point → hash by char
+    counts = [0] * 128
+    for c in s.encode():             # bytes → ints 0..127
+        counts[c] += 1
+    for c in t.encode():
+        counts[c] -= 1
+    return not any(counts)           # all zero ↔ same multiset
+
+# short strings: sorting in C is cheaper than building any table
+def is_anagram_sorted(s, t):
+    return len(s) == len(t) and sorted(s) == sorted(t)
 
 # 6. tuple as hashmap key
 grid_state = {}
@@ -144,6 +159,19 @@ cache = {}
 key = frozenset([1, 2])
 cache[key] = "valid"                 # works since frozenset is immutable
 
+# 8. top-k frequent for small non-negative ints (no hashing)
+# counts indexed by value → O(n + U log k), U = max(nums) + 1
+# only worth it when U isn't much larger than n; otherwise use Counter
+def top_k_ints(nums, k):
+    import heapq
+    if not nums:
+        return []
+    counts = [0] * (max(nums) + 1)
+    for x in nums:
+        counts[x] += 1               # list index, no hash / probe
+    top = heapq.nlargest(k, range(len(counts)), key=counts.__getitem__)
+    return [(v, counts[v]) for v in top if counts[v]]
+
 # ------------------------
 # 6️⃣ ORDERED HASHMAP
 # ------------------------
@@ -233,5 +261,7 @@ if c[key] == 0:
 
 # insert / access / delete: O(1) avg, O(n) worst
 # Counter / defaultdict access: O(1)
+# most_common(k): O(n log k)
+# top_k_ints (counting array): O(n + U log k), U = value range
 # set/dict lookup: O(1)
 # iteration over n items: O(n)
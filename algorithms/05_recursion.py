@@ -40,12 +40,14 @@ def fib(n):
         return n                    # base case: fib(0)=0, fib(1)=1
     return fib(n - 1) + fib(n - 2)  # sum of previous two → exponential time
 
+# ➕ O(log n) version: fib_fast (fast doubling) in 07_dynamic_programming.py
+
 # ------------------------
 # 3️⃣ STRINGS / LISTS
 # ------------------------
 
-# reverse string (list of chars) in-place
-def reverse_string(s):
+# reverse string (list of chars) in-place using recursion
+def reverse_string_recursive(s):
     def helper(left, right):
         if left >= right: return    # base case: finished reversing
         s[left], s[right] = s[right], s[left]  # swap ends
@@ -54,10 +56,18 @@ def reverse_string(s):
     helper(0, len(s) - 1)
 
 # check if string is palindrome using recursion
-def is_palindrome(s, left, right):
+def is_palindrome_recursive(s, left, right):
     if left >= right: return True   # base case: checked all pairs
     if s[left] != s[right]: return False
-    return is_palindrome(s, left + 1, right - 1)
+    return is_palindrome_recursive(s, left + 1, right - 1)
+
+# ✅ what to actually use: one C-level slice copy / compare, no recursion depth
+# (the recursive pair above hits RecursionError around len(s) ≈ 2000)
+def reverse_string(s):
+    s[:] = s[::-1]                  # in-place for lists; for str use s[::-1]
+
+def is_palindrome(s):
+    return s == s[::-1]
 
 # ------------------------
 # 4️⃣ RECURSION + BACKTRACKING
@@ -79,11 +89,34 @@ def subsets(nums):
 
 # ➕ uses: generate combinations, permutations, valid paths, etc.
 
+# same power set without recursion: bit i of mask = "take nums[i]"
+def subsets_bitmask(nums):
+    n = len(nums)
+    return [[nums[i] for i in range(n) if mask >> i & 1] for mask in range(1 << n)]
+
+# Gray-code order: consecutive subsets differ by ONE element
+# → update `cur` with a single append/remove instead of rebuilding it
+def subsets_gray(nums):
+    n = len(nums)
+    cur, taken = [], [False] * n
+    res = [[]]
+    for i in range(1, 1 << n):
+        b = (i & -i).bit_length() - 1      # bit flipped between gray(i-1) and gray(i)
+        if taken[b]:
+            cur.remove(nums[b])            # drop it (equal values are interchangeable)
+        else:
+            cur.append(nums[b])            # add it
+        taken[b] = not taken[b]
+        res.append(cur[:])                 # the copy is still O(len) per subset
+    return res
+
 # ------------------------
 # 5️⃣ TREE TRAVERSAL (DFS STYLE)
 # ------------------------
 
 class TreeNode:
+    __slots__ = ('val', 'left', 'right')   # no per-node __dict__ → smaller nodes, faster .val/.left
+
     def __init__(self, val, left=None, right=None):
         self.val = val
         self.left = left
@@ -102,32 +135,102 @@ def has_path_sum(root, target):
     return (has_path_sum(root.left, target - root.val) or
             has_path_sum(root.right, target - root.val))
 
+# ➕ same two with an explicit stack: no Python frame per node, no depth limit
+def tree_sum_iterative(root):
+    total = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node:
+            total += node.val
+            stack.append(node.left)
+            stack.append(node.right)
+    return total
+
+def has_path_sum_iterative(root, target):
+    stack = [(root, target)] if root else []   # (node, sum still needed)
+    while stack:
+        node, remaining = stack.pop()
+        remaining -= node.val
+        if not node.left and not node.right:    # leaf node
+            if remaining == 0:
+                return True
+            continue
+        if node.right: stack.append((node.right, remaining))
+        if node.left: stack.append((node.left, remaining))
+    return False
+
+# ➕ flat tree (struct of arrays): node i = val[i], left[i], right[i] (-1 = no child)
+# → three packed arrays instead of one scattered PyObject per node
+from array import array
+
+class FlatTree:
+    def __init__(self, n):
+        self.val = array('q', bytes(8 * n))    # int64 values, zero-filled
+        self.left = array('i', [-1]) * n       # child indices
+        self.right = array('i', [-1]) * n
+
+    @classmethod
+    def from_tree(cls, root):                  # number nodes in BFS order, root = 0
+        nodes = [root] if root else []
+        for node in nodes:                     # list grows while we walk it → BFS
+            if node.left: nodes.append(node.left)
+            if node.right: nodes.append(node.right)
+        ft = cls(len(nodes))
+        idx = {id(node): i for i, node in enumerate(nodes)}
+        for i, node in enumerate(nodes):
+            ft.val[i] = node.val
+            if node.left: ft.left[i] = idx[id(node.left)]
+            if node.right: ft.right[i] = idx[id(node.right)]
+        return ft
+
+def flat_tree_sum(ft, root=0):
+    if root < 0 or not ft.val: return 0
+    left, right, val = ft.left, ft.right, ft.val
+    total = 0
+    stack = [root]
+    while stack:
+        i = stack.pop()
+        total += val[i]
+        if left[i] >= 0: stack.append(left[i])
+        if right[i] >= 0: stack.append(right[i])
+    return total
+
+# whole tree from the root → no traversal needed at all: sum(ft.val)
+
 # build binary tree from preorder + inorder (classic recursive pattern)
+# O(n): value → inorder index map + (lo, hi) bounds, no slicing / .index()
 def build_tree(preorder, inorder):
-    if not preorder or not inorder: return None
-    root = TreeNode(preorder[0])             # first preorder = root
-    idx = inorder.index(preorder[0])         # locate root in inorder
-    root.left = build_tree(preorder[1:1+idx], inorder[:idx])
-    root.right = build_tree(preorder[1+idx:], inorder[idx+1:])
-    return root
+    pos = {v: i for i, v in enumerate(inorder)}  # locate root in inorder in O(1)
+    pre = iter(preorder)                     # preorder yields roots in build order
+
+    def build(lo, hi):                       # subtree = inorder[lo:hi]
+        if lo >= hi: return None
+        root = TreeNode(next(pre))           # next preorder value = this root
+        mid = pos[root.val]
+        root.left = build(lo, mid)           # left must be built first (preorder)
+        root.right = build(mid + 1, hi)
+        return root
+
+    return build(0, len(inorder))
 
 # ------------------------
 # 6️⃣ MEMOIZED RECURSION (TOP-DOWN DP)
 # ------------------------
 
-# fibonacci with memoization
-def fib_memo(n, memo={}):
-    if n in memo: return memo[n]             # return cached
+from functools import lru_cache
+
+# fibonacci with memoization (cache lookup happens in C, no shared memo={} default)
+@lru_cache(maxsize=None)
+def fib_memo(n):
     if n <= 1: return n
-    memo[n] = fib_memo(n - 1, memo) + fib_memo(n - 2, memo)
-    return memo[n]
+    return fib_memo(n - 1) + fib_memo(n - 2)
 
 # climb stairs: 1 or 2 steps at a time
-def climb_stairs(n, memo={}):
-    if n in memo: return memo[n]
+@lru_cache(maxsize=None)
+def climb_stairs(n):
     if n <= 1: return 1
-    memo[n] = climb_stairs(n - 1, memo) + climb_stairs(n - 2, memo)
-    return memo[n]
+    return climb_stairs(n - 1) + climb_stairs(n - 2)
 
 # ------------------------
 # 7️⃣ RECURSION VS ITERATION
@@ -150,7 +253,7 @@ def climb_stairs(n, memo={}):
 
 # ❌ missing base case → infinite recursion → RecursionError
 # ❌ modifying list in-place without copying in backtracking
-# ❌ memo = {} is shared across calls (intentional or risky?)
+# ❌ memo = {} default is shared across calls → prefer @lru_cache / @cache
 # ❌ Python recursion depth ≈ 1000 (sys.setrecursionlimit() needed)
 # ❌ expensive recomputation if no memo used (e.g., naive fib)
 
@@ -158,9 +261,7 @@ def climb_stairs(n, memo={}):
 # 🧰 PYTHON TOOLS
 # ------------------------
 
-# use standard lib caching
-from functools import lru_cache
-
+# use standard lib caching (fib_memo above uses the same decorator)
 @lru_cache(maxsize=None)
 def fib(n):
     if n <= 1: return n
@@ -170,6 +271,23 @@ def fib(n):
 import sys
 sys.setrecursionlimit(10**6)   # use cautiously
 
+# same naive recursion compiled to C and called through ctypes
+# → no Python frame per call; shows how much of naive fib is interpreter overhead
+# needs a C compiler (`cc`) on PATH; compiled once on first call, then cached
+_fib_c = None
+
+def fib_jit(n):
+    global _fib_c
+    if _fib_c is None:
+        import ctypes
+        import os, runpy                       # load the helper by path, not via sys.path
+        load_c = runpy.run_path(os.path.join(os.path.dirname(__file__), "_c_build.py"))["load_c"]
+        lib = load_c("long long fib(int n) { return n < 2 ? n : fib(n - 1) + fib(n - 2); }", "fib")
+        lib.fib.argtypes = [ctypes.c_int]
+        lib.fib.restype = ctypes.c_longlong    # exact up to fib(92), then overflows
+        _fib_c = lib.fib
+    return _fib_c(n)
+
 # ------------------------
 # 🧵 WHEN TO USE
 # ------------------------
@@ -188,5 +306,5 @@ sys.setrecursionlimit(10**6)   # use cautiously
 # naive fibonacci:                O(2^n)
 # memoized fibonacci:             O(n)
 # tree traversal:                 O(n)
-# subset generation:              O(2^n * n)
+# subset generation:              O(2^n * n) (bitmask/Gray: same, no recursion)
 # backtracking (e.g. permutations): O(n!)
@@ -83,17 +83,28 @@ def can_jump(nums):
         max_reach = max(max_reach, i + steps)  # update max reach
     return True
 
+# same check without the Python loop: running max of i + nums[i] in C
+# index i is reachable iff the best reach from indices < i is ≥ i
+def can_jump_scan(nums):
+    from itertools import accumulate, count
+    from operator import add, ge
+    reach = accumulate(map(add, count(), nums), max)   # reach[i] = max(j + nums[j] for j ≤ i)
+    return all(map(ge, reach, range(1, len(nums))))    # reach[i-1] ≥ i for every i ≥ 1
+
 # ------------------------
 # 6️⃣ MINIMUM JUMPS TO END
 # ------------------------
 
 # find minimum # of jumps to reach end
+# farthest = running max of i + nums[i] → precomputed by accumulate,
+# only the window bookkeeping stays in Python
 def jump(nums):
+    from itertools import accumulate, count
+    from operator import add
     jumps = 0
     end = 0                                # end of current jump window
-    farthest = 0                           # farthest we can reach so far
-    for i in range(len(nums) - 1):         # don't jump at last index
-        farthest = max(farthest, i + nums[i])
+    reach = accumulate(map(add, count(), nums[:-1]), max)  # don't jump at last index
+    for i, farthest in enumerate(reach):   # farthest we can reach so far
         if i == end:                       # time to jump
             jumps += 1
             end = farthest                # new jump window
@@ -114,6 +125,15 @@ def can_complete_circuit(gas, cost):
             start = i + 1                  # new candidate start
     return start
 
+# same answer from prefix sums: start right after the lowest point of the
+# running tank level (every later prefix is ≥ it, so the tank never goes < 0)
+def can_complete_circuit_prefix(gas, cost):
+    from itertools import accumulate
+    from operator import sub
+    tank = list(accumulate(map(sub, gas, cost), initial=0))  # tank[i] = net gas before station i
+    if tank[-1] < 0: return -1             # total gas < total cost
+    return tank.index(min(tank))           # first lowest point (tank[0] = 0 → never n)
+
 # ------------------------
 # 8️⃣ K-LARGEST ELEMENTS USING HEAP
 # ------------------------
@@ -121,14 +141,21 @@ def can_complete_circuit(gas, cost):
 import heapq
 
 # stream version: keep k largest seen so far
+# heap[0] = smallest of the current top-k → only a bigger x can get in
 def k_largest(nums, k):
-    heap = []
-    for x in nums:
-        heapq.heappush(heap, x)           # push every number
-        if len(heap) > k:
-            heapq.heappop(heap)           # pop smallest if > k
+    from itertools import islice
+    if k <= 0: return []
+    it = iter(nums)
+    heap = list(islice(it, k))            # first k items, no per-item push
+    heapq.heapify(heap)                   # O(k) build
+    for x in it:
+        if x > heap[0]:                   # beats the weakest kept item
+            heapq.heapreplace(heap, x)    # pop + push as ONE sift (never grows to k+1)
     return heap                           # size-k heap of largest elements
 
+# whole input available up front → one C call, result sorted largest first
+# heapq.nlargest(k, nums)
+
 # 🔁 greedy choice changes over time → need heap, not sorting
 
 # ------------------------
@@ -176,8 +203,8 @@ def k_largest(nums, k):
 # ------------------------
 
 # greedy + sort:         O(n log n)
-# jump game:             O(n)
-# gas station:           O(n)
+# jump game:             O(n) (scan version: one C-level pass)
+# gas station:           O(n) (prefix version: C-level accumulate/min/index)
 # heap-based greedy:     O(n log k)
 # Kruskal/Prim MST:      O(E log V)
 
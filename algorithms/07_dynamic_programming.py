@@ -41,23 +41,23 @@
 # 1️⃣ TOP-DOWN FIB (MEMOIZATION)
 # -----------------------------------------
 
-def fib(n, memo={}):
-    if n in memo: return memo[n]          # use cached result
+from functools import lru_cache
+
+@lru_cache(maxsize=None)                   # cache keyed on args, lookup runs in C
+def fib(n):
     if n <= 1: return n                    # base case
-    memo[n] = fib(n - 1, memo) + fib(n - 2, memo)  # recurse & store
-    return memo[n]
+    return fib(n - 1) + fib(n - 2)         # recurse; results stored by the cache
 
 # ✅ avoids recomputation
-# ⚠️ dict default param is shared across calls (ok here, risky elsewhere)
+# ✅ no `memo={}` default → nothing shared by accident, no dict passed per call
 
-# ✅ Alternative using Python’s built-in cache
-from functools import lru_cache
-
-@lru_cache(maxsize=None)
-def fib2(n):
-    if n <= 1:
-        return n
-    return fib2(n-1) + fib2(n-2)
+# ✅ Manual version (same idea, explicit dict) — make the memo per top-level call
+def fib2(n, memo=None):
+    if memo is None: memo = {}
+    if n in memo: return memo[n]          # use cached result
+    if n <= 1: return n
+    memo[n] = fib2(n - 1, memo) + fib2(n - 2, memo)  # recurse & store
+    return memo[n]
 
 # -----------------------------------------
 # 2️⃣ BOTTOM-UP FIB (TABULATION)
@@ -85,6 +85,26 @@ def fib_rolling(n):
 
 # ✅ memory: O(1) instead of O(n)
 
+# -----------------------------------------
+# 3️⃣➕ FAST DOUBLING FIB (O(log n))
+# -----------------------------------------
+
+# F(2k)   = F(k) * (2F(k+1) - F(k))
+# F(2k+1) = F(k)^2 + F(k+1)^2
+def fib_fast(n):
+    a, b = 0, 1                # (F(k), F(k+1)) with k = 0
+    for bit in bin(n)[2:]:     # walk bits of n from MSB to LSB
+        c = a * (2 * b - a)    # F(2k)
+        d = a * a + b * b      # F(2k+1)
+        if bit == '1':
+            a, b = d, c + d    # k → 2k + 1
+        else:
+            a, b = c, d        # k → 2k
+    return a
+
+# ✅ O(log n) big-int multiplications instead of n big-int additions
+# ✅ the one to use for huge n (fib(10**6) has ~200k digits)
+
 # -----------------------------------------
 # 4️⃣ CLIMBING STAIRS (LEETCODE 70)
 # -----------------------------------------
@@ -101,34 +121,38 @@ def climb_stairs(n):
 # -----------------------------------------
 
 def coin_change(coins, amount):
-    dp = [float('inf')] * (amount + 1)  # dp[i] = min coins to make i
+    INF = amount + 1                    # int sentinel: more coins than ever needed
+    dp = [INF] * (amount + 1)           # dp[i] = min coins to make i
     dp[0] = 0                           # base case
 
-    for i in range(1, amount + 1):
-        for c in coins:
-            if i - c >= 0:
-                dp[i] = min(dp[i], dp[i - c] + 1)
+    for c in coins:                     # coin-outer: no `i - c >= 0` check per cell
+        for i in range(c, amount + 1):  # ascending → coin c can be reused
+            if dp[i - c] + 1 < dp[i]:   # plain compare instead of a min() call
+                dp[i] = dp[i - c] + 1
+
+    return dp[amount] if dp[amount] != INF else -1
 
-    return dp[amount] if dp[amount] != float('inf') else -1
+# ⚠️ can't replace the inner loop with one whole-slice update
+#    (dp[c:] = min(dp[c:], dp[:-c] + 1)) → that reads the OLD row and
+#    lets each coin be used at most once per pass
 
 # -----------------------------------------
 # 6️⃣ 0/1 KNAPSACK
 # -----------------------------------------
 
 def knapsack(weights, values, W):
-    n = len(weights)
-    dp = [[0] * (W + 1) for _ in range(n + 1)]  # dp[i][w] = max val with i items, w weight
+    dp = [0] * (W + 1)                          # dp[w] = max val with items so far, w weight
 
-    for i in range(1, n + 1):
-        for w in range(W + 1):
-            if weights[i-1] > w:
-                dp[i][w] = dp[i-1][w]           # can't take item i
-            else:
-                dp[i][w] = max(
-                    dp[i-1][w],                 # don't take it
-                    values[i-1] + dp[i-1][w - weights[i-1]]  # take it
-                )
-    return dp[n][W]
+    for wt, val in zip(weights, values):
+        if wt > W: continue                     # can't take item at any capacity
+        # whole row at once: take[w] = val + dp[w - wt] (or dp[w] if it doesn't fit)
+        take = dp[:wt] + [val + x for x in dp[:W + 1 - wt]]
+        dp = list(map(max, dp, take))           # don't take vs take, max runs in C
+    return dp[W]
+
+# ✅ one row instead of (n+1) x (W+1)
+# ✅ `take` is built from the previous row → each item used at most once
+#    (the in-place version must loop w backwards instead, like can_partition)
 
 # -----------------------------------------
 # 7️⃣ SUBSET SUM / PARTITION EQUAL SUBSET SUM
@@ -138,31 +162,46 @@ def can_partition(nums):
     total = sum(nums)
     if total % 2 != 0: return False             # odd total = can't split evenly
     target = total // 2
-    dp = [False] * (target + 1)
-    dp[0] = True                                # base case
+    dp = bytearray(target + 1)                  # 1 byte per sum (a list costs 8 per slot)
+    dp[0] = 1                                   # base case
 
     for num in nums:
         for i in range(target, num - 1, -1):    # go backwards
-            dp[i] = dp[i] or dp[i - num]        # take or not
+            if dp[i - num]:                     # take or not
+                dp[i] = 1
 
-    return dp[target]
+    return dp[target] == 1
+
+# ✅ Bitset version: bit i of `bits` is dp[i]; one shift+or per number, in C
+def can_partition_bits(nums):
+    total = sum(nums)
+    if total % 2 != 0: return False
+    target = total // 2
+    bits = 1                                    # only sum 0 reachable
+    for num in nums:
+        bits |= bits << num                     # every reachable s → also s + num
+    return (bits >> target) & 1 == 1
 
 # -----------------------------------------
 # 8️⃣ LONGEST COMMON SUBSEQUENCE (LCS)
 # -----------------------------------------
 
 def lcs(s1, s2):
-    m, n = len(s1), len(s2)
-    dp = [[0]*(n+1) for _ in range(m+1)]
+    if len(s2) > len(s1):
+        s1, s2 = s2, s1                         # shorter string → row length
+    n = len(s2)
+    prev = [0] * (n + 1)                        # row i-1 of the full table
 
-    for i in range(1, m + 1):
+    for c1 in s1:
+        curr = [0] * (n + 1)                    # row i
         for j in range(1, n + 1):
-            if s1[i-1] == s2[j-1]:              # chars match
-                dp[i][j] = dp[i-1][j-1] + 1
+            if c1 == s2[j-1]:                   # chars match
+                curr[j] = prev[j-1] + 1
             else:
-                dp[i][j] = max(dp[i-1][j], dp[i][j-1])  # skip one
+                curr[j] = max(prev[j], curr[j-1])  # skip one
+        prev = curr                             # roll rows
 
-    return dp[m][n]
+    return prev[n]
 
 # -----------------------------------------
 # 9️⃣ EDIT DISTANCE (LEETCODE 72)
@@ -170,36 +209,100 @@ def lcs(s1, s2):
 
 def edit_distance(w1, w2):
     m, n = len(w1), len(w2)
-    dp = [[0]*(n+1) for _ in range(m+1)]
-
-    for i in range(m+1): dp[i][0] = i          # delete all
-    for j in range(n+1): dp[0][j] = j          # insert all
+    prev = list(range(n + 1))                  # row 0: insert all
 
     for i in range(1, m+1):
+        curr = [i] + [0] * n                   # column 0: delete all
         for j in range(1, n+1):
             if w1[i-1] == w2[j-1]:
-                dp[i][j] = dp[i-1][j-1]        # match
+                curr[j] = prev[j-1]            # match
             else:
-                dp[i][j] = 1 + min(
-                    dp[i-1][j],               # delete
-                    dp[i][j-1],               # insert
-                    dp[i-1][j-1]              # replace
+                curr[j] = 1 + min(
+                    prev[j],                  # delete
+                    curr[j-1],                # insert
+                    prev[j-1]                 # replace
                 )
+        prev = curr                            # roll rows
 
-    return dp[m][n]
+    return prev[n]
 
 # -----------------------------------------
 # 🔟 UNIQUE PATHS IN GRID (LEETCODE 62)
 # -----------------------------------------
 
 def unique_paths(m, n):
-    dp = [[1]*n for _ in range(m)]             # only 1 path in top row / left col
+    from itertools import accumulate
+    dp = [1] * n                               # top row: only 1 path per cell
 
     for i in range(1, m):
-        for j in range(1, n):
-            dp[i][j] = dp[i-1][j] + dp[i][j-1] # from top + left
-
-    return dp[m-1][n-1]
+        # dp[j] += dp[j-1] left to right is a running sum → accumulate does it in C
+        dp = list(accumulate(dp))              # from top (old dp[j]) + left
+
+    return dp[n-1]
+
+# -----------------------------------------
+# 🧰 COMPILED DP LOOPS (OPTIONAL)
+# -----------------------------------------
+
+# bottom-up DPs are flat int loops → compile them once, same trick as
+# fib_jit in 05_recursion.py (C via cc + ctypes, cached after first call)
+# ⚠️ only worth it for the iterative tables; recursive/memo versions gain little
+# ⚠️ C int64 → answers must fit in 64 bits (Python ints never overflow)
+_dp_c = None
+
+def _dp_lib():
+    global _dp_c
+    if _dp_c is None:
+        import ctypes
+        import os, runpy                       # load the helper by path, not via sys.path
+        load_c = runpy.run_path(os.path.join(os.path.dirname(__file__), "_c_build.py"))["load_c"]
+        # every index is long long: coins / weights are int64, so an int loop
+        # counter would truncate them
+        lib = load_c("""
+        long long coin_change(const long long *coins, long long n, long long amount, long long *dp) {
+            for (long long i = 1; i <= amount; i++) dp[i] = amount + 1;
+            dp[0] = 0;
+            for (long long k = 0; k < n; k++)
+                for (long long i = coins[k]; i <= amount; i++)
+                    if (dp[i - coins[k]] + 1 < dp[i]) dp[i] = dp[i - coins[k]] + 1;
+            return dp[amount] > amount ? -1 : dp[amount];
+        }
+        long long knapsack(const long long *wt, const long long *val, long long n, long long W, long long *dp) {
+            for (long long w = 0; w <= W; w++) dp[w] = 0;
+            for (long long k = 0; k < n; k++)
+                for (long long w = W; w >= wt[k]; w--)      /* backwards → item used once */
+                    if (dp[w - wt[k]] + val[k] > dp[w]) dp[w] = dp[w - wt[k]] + val[k];
+            return dp[W];
+        }
+        """, "dp")
+        i64, i64p = ctypes.c_longlong, ctypes.POINTER(ctypes.c_longlong)
+        lib.coin_change.argtypes = [i64p, i64, i64, i64p]
+        lib.knapsack.argtypes = [i64p, i64p, i64, i64, i64p]
+        lib.coin_change.restype = lib.knapsack.restype = i64
+        _dp_c = lib
+    return _dp_c
+
+# the C side trusts its inputs → the wrappers keep every index inside dp
+def coin_change_jit(coins, amount):
+    import ctypes
+    if amount < 0:
+        raise ValueError("amount must be >= 0")
+    coins = [c for c in coins if 0 < c <= amount]   # others can never be used
+    Arr = ctypes.c_longlong * len(coins)
+    dp = (ctypes.c_longlong * (amount + 1))()       # scratch row, owned by Python
+    return _dp_lib().coin_change(Arr(*coins), len(coins), amount, dp)
+
+def knapsack_jit(weights, values, W):
+    import ctypes
+    if W < 0:
+        raise ValueError("W must be >= 0")
+    if any(wt < 0 for wt in weights):
+        raise ValueError("weights must be >= 0")
+    items = [(wt, val) for wt, val in zip(weights, values) if wt <= W]  # too heavy → skip
+    n = len(items)
+    Arr = ctypes.c_longlong * n
+    dp = (ctypes.c_longlong * (W + 1))()
+    return _dp_lib().knapsack(Arr(*[wt for wt, _ in items]), Arr(*[val for _, val in items]), n, W, dp)
 
 # -----------------------------------------
 # 🧵 COMMON PATTERNS (NAME RECOGNITION)
@@ -221,6 +324,9 @@ def unique_paths(m, n):
 # ❌ Mutable default args (memo = {})
 # ❌ Missing cache in top-down → exponential
 # ❌ Wrong direction in tabulation (e.g., backwards needed for space-opt)
+# ❌ array('q') / bytearray rows are 4-8x smaller than lists, but every read in a
+#    Python loop builds a fresh int → often SLOWER than a list; use them when the
+#    table is huge or its buffer is handed to C, not for speed alone
 
 # -----------------------------------------
 # 📚 ADVANCED (FYI ONLY)
@@ -236,8 +342,10 @@ def unique_paths(m, n):
 # -----------------------------------------
 
 # fib (memo):                O(n)
+# fib (fast doubling):       O(log n) multiplications
 # coin change:               O(n * coins)
-# knapsack:                  O(n * W)
-# subset sum:                O(n * target)
-# edit distance / LCS:       O(m * n)
-# grid DP:                   O(m * n)
+# knapsack:                  O(n * W) time, O(W) space
+# compiled (_jit) versions:  same O(), native int loop (no per-cell interpreter cost)
+# subset sum:                O(n * target)  (bitset: same, but ~target/30 C ops per num)
+# edit distance / LCS:       O(m * n) time, O(min(m, n)) / O(n) space (rolling rows)
+# grid DP:                   O(m * n) time, O(n) space
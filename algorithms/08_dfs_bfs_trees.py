@@ -16,6 +16,8 @@
 # -----------------------------------------
 
 class TreeNode:
+    __slots__ = ('val', 'left', 'right')   # no per-node __dict__ → smaller nodes, faster .val/.left
+
     def __init__(self, val=0, left=None, right=None):
         self.val = val
         self.left = left
@@ -64,6 +66,81 @@ def dfs_iterative(root):
         if node.left:
             stack.append(node.left)
 
+# inorder with a stack: slide down the left spine, visit, then go right
+def inorder_iterative(root):
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)         # remember ancestors on the way down
+            node = node.left
+        node = stack.pop()
+        print(node.val)                # visit in the middle
+        node = node.right
+
+# postorder with a stack: emit root → right → left, then reverse
+def postorder_iterative(root):
+    if not root: return
+    stack, out = [root], []
+    while stack:
+        node = stack.pop()
+        out.append(node.val)
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    for val in reversed(out):          # reversed → left → right → root
+        print(val)
+
+# -----------------------------------------
+# 3️⃣➕ MORRIS TRAVERSAL — O(1) EXTRA SPACE
+# -----------------------------------------
+
+# no stack, no recursion: temporarily point the inorder predecessor's
+# empty .right back at the current node, follow it later, then undo it
+def inorder_morris(root):
+    cur = root
+    while cur:
+        if not cur.left:
+            print(cur.val)             # nothing on the left → visit, go right
+            cur = cur.right
+            continue
+        pre = cur.left
+        while pre.right and pre.right is not cur:
+            pre = pre.right            # rightmost node of left subtree
+        if not pre.right:
+            pre.right = cur            # thread: come back here after left side
+            cur = cur.left
+        else:
+            pre.right = None           # second visit → remove thread
+            print(cur.val)
+            cur = cur.right
+
+# mirror image of Morris (root → right → left) collected, then reversed
+# (the output list is O(n), but the walk itself needs no stack)
+def postorder_morris(root):
+    out = []
+    cur = root
+    while cur:
+        if not cur.right:
+            out.append(cur.val)
+            cur = cur.left
+            continue
+        pre = cur.right
+        while pre.left and pre.left is not cur:
+            pre = pre.left             # leftmost node of right subtree
+        if not pre.left:
+            out.append(cur.val)
+            pre.left = cur             # thread back to cur
+            cur = cur.right
+        else:
+            pre.left = None            # remove thread
+            cur = cur.left
+    for val in reversed(out):
+        print(val)
+
+# ⚠️ tree is modified during the walk → not safe with concurrent readers
+
 # -----------------------------------------
 # 4️⃣ BFS TREE — LEVEL ORDER
 # -----------------------------------------
@@ -105,6 +182,28 @@ def level_order(root):
         result.append(level)
     return result
 
+# same output, None in the queue marks the end of a level
+# → no range(len(queue)) object per level (helps most on tall, narrow trees)
+def level_order_sentinel(root):
+    if not root: return []
+    queue = deque([root, None])
+    result, level = [], []
+
+    while queue:
+        node = queue.popleft()
+        if node is None:                  # current level finished
+            result.append(level)
+            level = []
+            if queue:                     # next level fully queued → close it too
+                queue.append(None)
+            continue
+        level.append(node.val)
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+    return result
+
 # -----------------------------------------
 # 6️⃣ DFS ON GRAPH — WITH VISITED SET
 # -----------------------------------------
@@ -123,18 +222,22 @@ def dfs_graph(graph, node, visited):
 # 7️⃣ BFS ON GRAPH — LEVEL ORDER / SHORTEST PATH STYLE
 # -----------------------------------------
 
+# mark visited on ENQUEUE → each node enters the queue once
+# (marking on dequeue lets a node sit in the queue once per incoming edge)
 def bfs_graph(graph, start):
-    visited = set()
+    visited = {start}
     queue = deque([start])
 
     while queue:
         node = queue.popleft()
-        if node in visited:
-            continue
-        visited.add(node)
         print(node)
         for neighbor in graph[node]:
-            queue.append(neighbor)
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+# graph of sets → new frontier via C-level set ops (order within a level is arbitrary)
+# fresh = graph[node] - visited; visited |= fresh; queue.extend(fresh)
 
 # -----------------------------------------
 # 8️⃣ DFS GRID (e.g. flood fill, islands)
@@ -154,33 +257,83 @@ def dfs_grid(grid, r, c, visited):
 
 # grid = 2D list, visited = set of (r, c)
 
+# iterative version: explicit stack (no recursion limit on big islands)
+# + flat bytearray mask → 1 byte per cell instead of a hashed (r, c) tuple
+def dfs_grid_iterative(grid, r, c, seen=None):
+    rows, cols = len(grid), len(grid[0])
+    if seen is None:
+        seen = bytearray(rows * cols)  # seen[r * cols + c] = 1 once visited
+    stack = [(r, c)]
+    while stack:
+        r, c = stack.pop()
+        if (r < 0 or c < 0 or r >= rows or c >= cols or
+            seen[r * cols + c] or grid[r][c] == 0):
+            continue
+        seen[r * cols + c] = 1         # mark current cell
+        for dr, dc in DIRS:
+            stack.append((r + dr, c + dc))
+    return seen
+
+# count islands: pass the same mask to every call so cells aren't revisited
+# seen = bytearray(rows * cols)
+# for r in range(rows):
+#     for c in range(cols):
+#         if grid[r][c] and not seen[r * cols + c]:
+#             dfs_grid_iterative(grid, r, c, seen); islands += 1
+
 # -----------------------------------------
 # 9️⃣ CYCLE DETECTION IN DIRECTED GRAPH
 # -----------------------------------------
 
-def has_cycle(graph):
-    visited = set()
-    path = set()  # nodes currently in recursion stack
+# one color per node instead of two sets: 0 = unseen, 1 = on current path, 2 = done
+# explicit stack of (node, neighbor iterator) → no recursion limit
+_END = object()                          # iterator-exhausted marker (can't be a node label)
 
-    def dfs(node):
-        if node in path: return True     # cycle detected
-        if node in visited: return False # already checked
-        visited.add(node)
-        path.add(node)
-        for nei in graph[node]:
-            if dfs(nei): return True
-        path.remove(node)                # backtrack
-        return False
-
-    for node in graph:
-        if dfs(node): return True
+def has_cycle(graph):
+    color = dict.fromkeys(graph, 0)
+
+    for start in graph:
+        if color[start]: continue
+        color[start] = 1
+        stack = [(start, iter(graph[start]))]
+        while stack:
+            node, it = stack[-1]
+            nei = next(it, _END)
+            if nei is _END:                  # all neighbors explored
+                stack.pop()
+                color[node] = 2              # backtrack: off the path for good
+            elif color[nei] == 1:
+                return True                  # back edge → cycle detected
+            elif color[nei] == 0:
+                color[nei] = 1               # go deeper
+                stack.append((nei, iter(graph[nei])))
     return False
 
 # -----------------------------------------
-# 🔟 TOPOLOGICAL SORT (POSTORDER DFS)
+# 🔟 TOPOLOGICAL SORT (KAHN'S ALGORITHM / POSTORDER DFS)
 # -----------------------------------------
 
+# Kahn's: repeatedly take a node nothing points to anymore
+# iterative → no recursion limit, no Python frame per node
 def topo_sort(graph):
+    indeg = {node: 0 for node in graph}
+    for node in graph:
+        for nei in graph[node]:
+            indeg[nei] += 1                # count incoming edges
+
+    queue = deque(node for node in graph if indeg[node] == 0)
+    result = []
+    while queue:
+        node = queue.popleft()
+        result.append(node)
+        for nei in graph[node]:
+            indeg[nei] -= 1                # "remove" edge node → nei
+            if indeg[nei] == 0:            # all prerequisites placed
+                queue.append(nei)
+    return result                          # len(result) < len(graph) → cycle
+
+# same result via recursive DFS (any valid order, may differ from Kahn's)
+def topo_sort_dfs(graph):
     visited = set()
     result = []
 
@@ -229,9 +382,11 @@ def bfs_with_parents(graph, start):
 # ❌ DFS on graph w/o visited set → infinite loop
 # ❌ Don’t reuse mutable path lists across calls (backtrack properly)
 # ❌ Grid DFS must check bounds and visited
-# ❌ Topological sort assumes DAG (no cycles)
+# ❌ Topological sort assumes DAG (no cycles) → Kahn's returns fewer than V nodes if not
 # ❌ Recursive DFS can hit stack overflow → use iterative version
+#    (each recursive call also allocates a Python frame → stack versions are faster)
 # ❌ BFS requires fixed-level processing for correct layer separation
+# ❌ BFS: mark visited when pushing, not when popping → no duplicate queue entries
 
 # -----------------------------------------
 # 🧵 WHEN TO USE WHICH
@@ -254,9 +409,10 @@ def bfs_with_parents(graph, start):
 # -----------------------------------------
 
 # Tree DFS/BFS:               O(n)
+# Morris traversal:          O(n) time, O(1) extra space
 # Graph DFS/BFS:              O(V + E)
-# Grid DFS/BFS:               O(R * C)
+# Grid DFS/BFS:               O(R * C) (bytearray mask: R * C bytes)
 # BFS with levels:            O(n)
-# Topological sort (DFS):     O(V + E)
+# Topological sort:           O(V + E) (Kahn's or DFS)
 # Cycle detection:            O(V + E)
 # Path reconstruction:        O(n)
@@ -10,7 +10,14 @@
 # 1️⃣ BINARY SEARCH (INTEGER, CLASSIC)
 # -----------------------------------------
 
+from bisect import bisect_left
+
 def binary_search(arr, target):
+    i = bisect_left(arr, target)       # search loop runs in C
+    return i if i < len(arr) and arr[i] == target else -1   # -1 = not found
+
+# hand-written version (same result when target is unique)
+def binary_search_manual(arr, target):
     left, right = 0, len(arr) - 1
     while left <= right:
         mid = (left + right) // 2      # middle index
@@ -48,6 +55,10 @@ def binary_search_float(low, high, condition, eps=1e-6):
 # -----------------------------------------
 
 def lower_bound(arr, target):
+    return bisect_left(arr, target)   # same search, written in C
+
+# hand-written version (interviews, or custom comparisons)
+def lower_bound_manual(arr, target):
     left, right = 0, len(arr)
     while left < right:
         mid = (left + right) // 2
@@ -64,11 +75,8 @@ def lower_bound(arr, target):
 # -----------------------------------------
 
 def prefix_sum(arr):
-    n = len(arr)
-    pre = [0] * (n + 1)
-    for i in range(n):
-        pre[i+1] = pre[i] + arr[i]     # build cumulative total
-    return pre
+    from itertools import accumulate
+    return list(accumulate(arr, initial=0))   # running total built in C, pre[0] = 0
 
 # Range sum [l, r] = pre[r+1] - pre[l]
 
@@ -77,20 +85,35 @@ def prefix_sum(arr):
 # -----------------------------------------
 
 def prefix_sum_2d(grid):
-    rows, cols = len(grid), len(grid[0])
-    pre = [[0] * (cols + 1) for _ in range(rows + 1)]
-
-    for r in range(rows):
-        for c in range(cols):
-            pre[r+1][c+1] = (grid[r][c]
-                            + pre[r][c+1]
-                            + pre[r+1][c]
-                            - pre[r][c])  # inclusion-exclusion
-    return pre
+    from itertools import accumulate
+    from operator import add
+    cols = len(grid[0])
+    # pass 1: prefix sum along each row; pass 2: running sum of those rows
+    # → pre[r][c] = sum of grid[:r][:c], no inclusion-exclusion needed
+    row_sums = (accumulate(row, initial=0) for row in grid)
+    return list(accumulate(row_sums,
+                           lambda above, row: list(map(add, above, row)),
+                           initial=[0] * (cols + 1)))
 
 # Query (r1,c1) to (r2,c2) with 1-based prefix:
 # pre[r2+1][c2+1] - pre[r1][c2+1] - pre[r2+1][c1] + pre[r1][c1]
 
+# same table in ONE contiguous int64 block, row-major: pre[r][c] → flat[r * W + c]
+# (one buffer instead of rows+1 separate lists of boxed ints)
+def prefix_sum_2d_flat(grid):
+    from array import array
+    from itertools import accumulate
+    from operator import add
+    W = len(grid[0]) + 1
+    prev = array('q', bytes(8 * W))          # row 0 = all zeros
+    flat = array('q', prev)
+    for row in grid:
+        prev = array('q', map(add, prev, accumulate(row, initial=0)))
+        flat.extend(prev)
+    return flat, W
+
+# Query: flat[(r2+1)*W + c2+1] - flat[r1*W + c2+1] - flat[(r2+1)*W + c1] + flat[r1*W + c1]
+
 # -----------------------------------------
 # 6️⃣ DIFFERENCE ARRAY (RANGE UPDATES)
 # -----------------------------------------
@@ -101,8 +124,8 @@ def range_add(diff, l, r, val):
         diff[r + 1] -= val
 
 def apply_diff(diff):
-    for i in range(1, len(diff)):
-        diff[i] += diff[i - 1]
+    from itertools import accumulate
+    diff[:] = accumulate(diff)         # in-place prefix sum, loop runs in C
     return diff
 
 # Good for multiple range adds, then 1 pass application
@@ -112,10 +135,12 @@ def apply_diff(diff):
 # -----------------------------------------
 
 def max_subarray(arr):
-    curr = res = arr[0]
-    for i in range(1, len(arr)):
-        curr = max(arr[i], curr + arr[i])  # extend or restart
-        res = max(res, curr)               # track max
+    it = iter(arr)
+    curr = res = next(it)
+    for x in it:                           # no index, no max() calls per element
+        curr = curr + x if curr > 0 else x # extend (prefix helps) or restart
+        if curr > res:
+            res = curr                     # track max
     return res
 
 # Time: O(n)
@@ -125,29 +150,53 @@ def max_subarray(arr):
 # 8️⃣ UNION FIND (DISJOINT SET UNION)
 # -----------------------------------------
 
+from array import array
+
 class UnionFind:
     def __init__(self, n):
-        self.parent = list(range(n))     # parent[i] = i
-        self.rank = [0] * n              # depth info for optimization
+        # packed int32 arrays: 4 bytes per slot vs ~36 for a list of ints
+        self.parent = array('i', range(n))   # parent[i] = i
+        self.size = array('i', [1]) * n      # size[root] = # nodes in its set
 
     def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # compress path
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving: point to grandparent
+            x = parent[x]                  # and jump there
+        return x
 
     def union(self, x, y):
         px, py = self.find(x), self.find(y)
         if px == py: return False        # already connected
-        if self.rank[px] < self.rank[py]:
-            self.parent[px] = py
-        elif self.rank[px] > self.rank[py]:
-            self.parent[py] = px
-        else:
-            self.parent[py] = px
-            self.rank[px] += 1
+        if self.size[px] < self.size[py]:
+            px, py = py, px              # px = root of the bigger set
+        self.parent[py] = px             # hang smaller tree under bigger
+        self.size[px] += self.size[py]
         return True
 
+    def union_edges(self, edges):
+        # batch union: same logic with find inlined and arrays in locals
+        # → no method calls per edge; returns how many edges joined two sets
+        parent, size = self.parent, self.size
+        merged = 0
+        for x, y in edges:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y: continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged += 1
+        return merged
+
 # Used for: connected components, Kruskal MST, cycle detection
+# find: one pass, no recursion → long chains can't hit the recursion limit
+# union by size: same O(log n) height bound as rank, and size[root] = component size for free
 
 # -----------------------------------------
 # 9️⃣ BIT TRICKS
@@ -160,8 +209,12 @@ x ^ 0           # x
 x >> 1          # divide by 2
 x << 1          # multiply by 2
 
-# Count set bits:
+# Count set bits (Python 3.10+: one C call; older: bin(x).count('1'))
 def count_bits(x):
+    return x.bit_count()
+
+# Kernighan's loop: one iteration per set bit (the interview answer)
+def count_bits_kernighan(x):
     count = 0
     while x:
         x &= (x - 1)   # drop lowest 1
@@ -178,6 +231,9 @@ def all_subsets(arr):
         subset = [arr[i] for i in range(n) if mask & (1 << i)]
         print(subset)
 
+# ➕ Gray-code order (one element toggled per step, no rebuild per mask):
+#    subsets_gray in 05_recursion.py
+
 # Key for:
 # - knapsack problems
 # - subset enumeration
@@ -208,6 +264,9 @@ def max_sliding_window(nums, k):
             res.append(nums[q[0]])  # max in window
     return res
 
+# ➕ preallocated head/tail buffer layout: max_sliding_window_buffer in
+#    03_sliding_window.py (only pays off when compiled)
+
 # Time: O(n)
 
 # -----------------------------------------
@@ -216,8 +275,8 @@ def max_sliding_window(nums, k):
 
 def compress(arr):
     sorted_unique = sorted(set(arr))          # dedupe + sort
-    mapping = {val: i for i, val in enumerate(sorted_unique)}
-    return [mapping[x] for x in arr]          # replace with index
+    mapping = dict(zip(sorted_unique, range(len(sorted_unique))))  # value → rank, built in C
+    return list(map(mapping.__getitem__, arr))  # replace with index, lookup loop in C
 
 # Use: transform large-range values into dense index space
 
@@ -230,9 +289,13 @@ def majority_element(nums):
     candidate = None
 
     for num in nums:
-        if count == 0:
+        if num == candidate:             # most common case first: one compare
+            count += 1
+        elif count:                      # different value cancels one vote
+            count -= 1
+        else:                            # no votes left → new candidate
             candidate = num
-        count += (1 if num == candidate else -1)
+            count = 1
     return candidate
 
 # Finds element that occurs > n//2 times
@@ -256,6 +319,22 @@ def reservoir_sample(stream):
 # - can't store full input
 # Time: O(n), Space: O(1)
 
+# skip-ahead version (Vitter's Algorithm L, k = 1): draw HOW MANY items to skip
+# instead of one random number per item → ~ln(n) RNG calls, skipping runs in C
+def reservoir_sample_skip(stream):
+    import math
+    from itertools import islice
+    it = iter(stream)
+    result = next(it, None)
+    w = random.random()                    # current keep-probability threshold
+    while True:
+        skip = int(math.log(random.random()) / math.log(1 - w))  # geometric gap
+        nxt = next(islice(it, skip, None), it)                  # `it` = "ran out" marker
+        if nxt is it:
+            return result
+        result = nxt
+        w *= random.random()
+
 # -----------------------------------------
 # 1️⃣5️⃣ FISHER-YATES SHUFFLE
 # -----------------------------------------
@@ -272,14 +351,18 @@ def shuffle(arr):
 # -----------------------------------------
 
 def merge_intervals(intervals):
-    intervals.sort()               # sort by start
+    if not intervals: return []
+    intervals.sort()               # sort by start (C Timsort)
     res = []
+    cur_start, cur_end = intervals[0]          # open interval kept in locals
 
     for start, end in intervals:
-        if not res or res[-1][1] < start:
-            res.append([start, end])           # new interval
-        else:
-            res[-1][1] = max(res[-1][1], end)  # merge with previous
+        if start > cur_end:
+            res.append([cur_start, cur_end])   # close it, start a new interval
+            cur_start, cur_end = start, end
+        elif end > cur_end:
+            cur_end = end                      # merge: extend (no max() call)
+    res.append([cur_start, cur_end])
     return res
 
 # Used for:
@@ -294,6 +377,8 @@ def merge_intervals(intervals):
 # ❌ Binary search assumes sorted input
 # ❌ Bitmasking works only for small n (≤ 20)
 # ❌ Union-Find needs compression for efficiency
+# ❌ Union-Find recursive find → RecursionError on a long uncompressed chain (keep it iterative)
+# ❌ Union-Find array('i') storage caps n at 2^31 - 1
 # ❌ Reservoir sampling is for unknown-size streams
 # ❌ Difference array requires careful boundary handling
 # ❌ Sliding window max fails if you forget to clear out-of-range index
@@ -307,9 +392,9 @@ def merge_intervals(intervals):
 # Prefix query:               O(1)
 # Kadane’s:                   O(n)
 # Bit tricks:                 O(log x)
-# Bitmask subsets:            O(2^n)
+# Bitmask subsets:            O(2^n) masks (O(n) to build each; Gray: one toggle per step)
 # Union-Find ops:             O(α(n)) amortized
-# Reservoir sampling:         O(n)
+# Reservoir sampling:         O(n) (skip version: O(n) to read, O(log n) RNG calls)
 # Shuffle (Fisher-Yates):     O(n)
 # Merge intervals:            O(n log n)
 # Sliding window max:         O(n)
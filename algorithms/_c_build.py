@@ -0,0 +1,25 @@
+# -----------------------------------------
+# 🧰 SHARED: COMPILE A C SNIPPET → ctypes LIBRARY
+# -----------------------------------------
+
+# used by fib_jit (05_recursion.py) and the compiled DP loops (07_dynamic_programming.py)
+# needs a C compiler (`cc`) on PATH
+# callers load this file by path (runpy.run_path next to their own __file__),
+# so it works whether or not algorithms/ is on sys.path
+
+def load_c(src, name):
+    import ctypes, os, subprocess, tempfile
+    # build in a throwaway dir; once CDLL has mapped the .so the files can go
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+        c_path = os.path.join(tmp, name + ".c")
+        so_path = os.path.join(tmp, name + ".so")
+        with open(c_path, "w") as f:
+            f.write(src)
+        try:
+            subprocess.run(["cc", "-O2", "-shared", "-fPIC", c_path, "-o", so_path],
+                           check=True, capture_output=True, text=True)
+        except FileNotFoundError:
+            raise RuntimeError(f"compiling {name}: no C compiler (`cc`) on PATH") from None
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"compiling {name}: cc failed\n{e.stderr}") from None
+        return ctypes.CDLL(so_path)
@@ -77,10 +77,14 @@ def dfs(graph, start):
         node = stack.pop()
         if node not in visited:
             visited.add(node)
-            for neighbor in reversed(graph[node]):
-                stack.append(neighbor)
+            for neighbor in graph[node]:      # forward order: no reversed() iterator per node
+                if neighbor not in visited:   # skip pushes that would be popped and ignored
+                    stack.append(neighbor)
     return visited
 
+# visits last-listed neighbor first; iterate reversed(graph[node]) only if
+# the exact left-to-right visit order matters (the visited set is the same)
+
 # ------------------------
 # 🧮 COMMON STACK PATTERNS
 # ------------------------
@@ -124,6 +128,10 @@ def next_greater(nums):
         stack.append(i)
     return res
 
+# 🧠 list append/pop is already the fastest stack in CPython: a preallocated
+#    stk = [0] * n with a `top` index gains nothing (the index math costs what
+#    append/pop did) → that fixed-buffer layout only pays off when compiled (C/ctypes)
+
 # ------------------------
 # 🧰 PYTHON-SPECIFIC TOOLS
 # ------------------------
@@ -101,6 +101,32 @@ def bfs(graph, start):
                 q.append(neighbor)
     return visited
 
+# same BFS on a fixed graph with nodes 0..n-1, flattened once into CSR arrays:
+# neighbors of u = indices[indptr[u]:indptr[u+1]] → no dict/set work per visit
+from array import array
+
+def to_csr(graph, n):
+    indptr = array('i', [0]) * (n + 1)
+    indices = array('i')
+    for u in range(n):
+        indices.extend(graph[u])
+        indptr[u + 1] = len(indices)
+    return indptr, indices
+
+def bfs_csr(indptr, indices, start):
+    seen = bytearray(len(indptr) - 1)   # 1 byte per node instead of a hash set
+    seen[start] = 1
+    order = [start]                      # list + read cursor = queue, never popped
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if not seen[v]:
+                seen[v] = 1
+                order.append(v)
+    return order                         # nodes in visit order (set(order) = bfs())
+
 # ------------------------
 # 🔁 BFS (MULTI-SOURCE)
 # ------------------------
@@ -147,6 +173,31 @@ def sliding_window_max(nums, k):
             result.append(nums[q[0]])
     return result
 
+# same queue as two pointers into a preallocated index list (each i pushed once → n slots)
+# popleft → head += 1, pop → tail -= 1, no deque method calls
+def sliding_window_max_buffer(nums, k):
+    n = len(nums)
+    if n < k: return []
+    q = [0] * n
+    head = tail = 0
+    result = [0] * (n - k + 1)
+
+    for i, val in enumerate(nums):
+        while head < tail and nums[q[tail - 1]] < val:
+            tail -= 1
+        q[tail] = i
+        tail += 1
+
+        if q[head] == i - k:
+            head += 1
+
+        if i >= k - 1:
+            result[i - k + 1] = nums[q[head]]
+    return result
+
+# ⚠️ in CPython this is only a wash vs deque (pointer math costs what the method calls did);
+# the buffer layout pays off once the loop is compiled (numba / C) → then q is a flat int64 array
+
 # ------------------------
 # 🧰 PYTHON-SPECIFIC TOOLS
 # ------------------------
@@ -111,6 +111,34 @@ class LinkedList:
     def print(self):
         print_list(self.head)
 
+# same API on top of collections.deque (C doubly linked list of blocks)
+# → use when you only need the operations, not the nodes themselves
+from collections import deque
+
+class FastList:
+    def __init__(self):
+        self.d = deque()
+
+    def insert_front(self, val):
+        self.d.appendleft(val)         # O(1) in C
+
+    def insert_end(self, val):
+        self.d.append(val)             # O(1) in C
+
+    def delete_val(self, val):
+        try:
+            self.d.remove(val)         # still O(n), but the scan runs in C
+        except ValueError:
+            pass                       # missing value → no-op, like LinkedList
+
+    def find(self, val):
+        return val in self.d           # O(n) C-level scan
+
+    def print(self):
+        print(*self.d, "None", sep=" -> ")   # same output as print_list
+
+# ⚠️ no node handles → can't splice / reverse in place / keep O(1) refs for an LRU cache
+
 # ------------------------
 # 🔁 REVERSAL
 # ------------------------
@@ -136,22 +164,22 @@ def middle_node(head):
     return slow
 
 # ------------------------
-# 🔁 REMOVE NTH FROM END (2-PASS)
+# 🔁 REMOVE NTH FROM END (1-PASS, GAP OF n)
 # ------------------------
 
 def remove_nth_from_end(head, n):
     dummy = ListNode(0, head)
-    length = 0
-    cur = head
-    while cur:
-        length += 1
-        cur = cur.next
-    cur = dummy
-    for _ in range(length - n):
-        cur = cur.next
-    cur.next = cur.next.next
+    fast = slow = dummy
+    for _ in range(n):
+        fast = fast.next               # open a gap of n nodes
+    while fast.next:
+        fast = fast.next               # move both until fast hits the last node
+        slow = slow.next
+    slow.next = slow.next.next         # slow is right before the target
     return dummy.next
 
+# one walk over the list instead of count-then-walk (each node touched once)
+
 # ------------------------
 # 🔁 CYCLE DETECTION
 # ------------------------
@@ -169,15 +197,22 @@ def has_cycle(head):
 # 🔁 MERGE TWO SORTED LISTS
 # ------------------------
 
+# splice whole runs: nodes inside a run are already linked to each other,
+# so only write cur.next where the output switches lists
 def merge(l1, l2):
     dummy = ListNode()
     cur = dummy
     while l1 and l2:
         if l1.val < l2.val:
-            cur.next, l1 = l1, l1.next
+            cur.next = l1
+            while l1.next and l1.next.val < l2.val:
+                l1 = l1.next               # extend the l1 run
+            cur, l1 = l1, l1.next
         else:
-            cur.next, l2 = l2, l2.next
-        cur = cur.next
+            cur.next = l2
+            while l2.next and not l1.val < l2.next.val:
+                l2 = l2.next               # extend the l2 run (ties stay with l2)
+            cur, l2 = l2, l2.next
     cur.next = l1 or l2
     return dummy.next
 
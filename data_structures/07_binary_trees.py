@@ -58,6 +58,61 @@ def postorder(root):
         postorder(root.right)
         print(root.val)
 
+# ------------------------
+# 🔁 DFS TRAVERSALS (ITERATIVE — EXPLICIT STACK)
+# ------------------------
+
+# same orders, no Python frame per node, no recursion-depth limit
+
+def preorder_iterative(root):
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        print(node.val)
+        if node.right: stack.append(node.right)   # right first → left popped first
+        if node.left: stack.append(node.left)
+
+def inorder_iterative(root):
+    stack, node = [], root
+    while node or stack:
+        while node:
+            stack.append(node)         # walk down the left spine
+            node = node.left
+        node = stack.pop()
+        print(node.val)
+        node = node.right
+
+# Morris inorder: O(1) extra space — thread the inorder predecessor's empty
+# .right back to the current node, follow it later, then remove it
+# (tree is temporarily modified → don't share it with other readers meanwhile)
+def inorder_morris(root):
+    cur = root
+    while cur:
+        if not cur.left:
+            print(cur.val)
+            cur = cur.right
+            continue
+        pre = cur.left
+        while pre.right and pre.right is not cur:
+            pre = pre.right            # rightmost node of left subtree
+        if not pre.right:
+            pre.right = cur            # thread → come back after the left side
+            cur = cur.left
+        else:
+            pre.right = None           # second visit → unthread
+            print(cur.val)
+            cur = cur.right
+
+def postorder_iterative(root):
+    stack, out = ([root] if root else []), []
+    while stack:
+        node = stack.pop()
+        out.append(node.val)           # root → right → left ...
+        if node.left: stack.append(node.left)
+        if node.right: stack.append(node.right)
+    for val in reversed(out):          # ... reversed = left → right → root
+        print(val)
+
 # ------------------------
 # 🔁 BFS (LEVEL-ORDER TRAVERSAL)
 # ------------------------
@@ -75,27 +130,36 @@ def level_order(root):
         if node.right: q.append(node.right)
     return res
 
+# same order, no deque: the output list IS the queue (a for-loop over a list
+# keeps seeing items appended during the loop) → no popleft per node, nothing popped
+def level_order_list(root):
+    if not root: return []
+    nodes = [root]
+    for node in nodes:
+        if node.left: nodes.append(node.left)
+        if node.right: nodes.append(node.right)
+    return [node.val for node in nodes]
+
 # ------------------------
 # 📦 BUILD TREE FROM ARRAY (LEETCODE FORMAT)
 # ------------------------
 
+# allocate every node up front (array order = BFS order), then link in one pass:
+# non-None nodes take their children from the same list, two at a time, in order
 def build_tree(arr):
     if not arr or arr[0] is None:
         return None
-    root = TreeNode(arr[0])
-    q = deque([root])
-    i = 1
-    while q and i < len(arr):
-        node = q.popleft()
-        if i < len(arr) and arr[i] is not None:
-            node.left = TreeNode(arr[i])
-            q.append(node.left)
-        i += 1
-        if i < len(arr) and arr[i] is not None:
-            node.right = TreeNode(arr[i])
-            q.append(node.right)
-        i += 1
-    return root
+    nodes = [None if v is None else TreeNode(v) for v in arr]
+    n = len(nodes)
+    i = 1                                  # next slot to hand out as a child (root is nobody's)
+    for p, node in enumerate(nodes):
+        if p >= i or i >= n:
+            break                          # p was never handed out (orphan) / no children left
+        if node:
+            node.left = nodes[i]           # None slot → missing child
+            node.right = nodes[i + 1] if i + 1 < n else None
+            i += 2
+    return nodes[0]
 
 # ------------------------
 # 🔁 DEPTH / HEIGHT
@@ -105,6 +169,17 @@ def max_depth(root):
     if not root: return 0
     return 1 + max(max_depth(root.left), max_depth(root.right))
 
+def max_depth_iterative(root):
+    stack = [(root, 1)]
+    best = 0
+    while stack:
+        node, d = stack.pop()
+        if node:
+            if d > best: best = d
+            stack.append((node.left, d + 1))
+            stack.append((node.right, d + 1))
+    return best
+
 # ------------------------
 # 🔁 DIAMETER (LONGEST PATH)
 # ------------------------
@@ -121,6 +196,23 @@ def diameter(root):
     dfs(root)
     return res
 
+# iterative postorder: (node, children_done) pairs, heights kept in a dict
+def diameter_iterative(root):
+    height = {None: 0}
+    res = 0
+    stack = [(root, False)] if root else []
+    while stack:
+        node, done = stack.pop()
+        if done:                            # both subtrees already measured
+            l, r = height[node.left], height[node.right]
+            if l + r > res: res = l + r
+            height[node] = 1 + (l if l > r else r)
+        else:
+            stack.append((node, True))      # come back after the children
+            if node.right: stack.append((node.right, False))
+            if node.left: stack.append((node.left, False))
+    return res
+
 # ------------------------
 # 🔁 IS BALANCED
 # ------------------------
@@ -134,6 +226,47 @@ def is_balanced(root):
         return 1 + max(l, r)
     return dfs(root) != -1
 
+def is_balanced_iterative(root):
+    height = {None: 0}
+    stack = [(root, False)] if root else []
+    while stack:
+        node, done = stack.pop()
+        if done:
+            l, r = height[node.left], height[node.right]
+            if abs(l - r) > 1: return False  # stop at the first bad subtree
+            height[node] = 1 + (l if l > r else r)
+        else:
+            stack.append((node, True))
+            if node.right: stack.append((node.right, False))
+            if node.left: stack.append((node.left, False))
+    return True
+
+# ------------------------
+# 🔁 DEPTH + DIAMETER + BALANCED IN ONE WALK
+# ------------------------
+
+from collections import namedtuple
+
+TreeStats = namedtuple('TreeStats', 'depth diameter balanced')
+
+# all three read the same child heights → one postorder pass instead of three
+def tree_stats(root):
+    height = {}                             # only nodes whose parent isn't done yet
+    diam, balanced = 0, True
+    stack = [(root, False)] if root else []
+    while stack:
+        node, done = stack.pop()
+        if done:
+            l, r = height.pop(node.left, 0), height.pop(node.right, 0)  # None → 0
+            if l + r > diam: diam = l + r
+            if abs(l - r) > 1: balanced = False  # no early exit: depth/diameter still needed
+            height[node] = 1 + (l if l > r else r)
+        else:
+            stack.append((node, True))
+            if node.right: stack.append((node.right, False))
+            if node.left: stack.append((node.left, False))
+    return TreeStats(height.pop(root, 0), diam, balanced)
+
 # ------------------------
 # 🔁 INVERT TREE
 # ------------------------
@@ -153,6 +286,18 @@ def has_path_sum(root, target):
         return target == root.val
     return has_path_sum(root.left, target - root.val) or has_path_sum(root.right, target - root.val)
 
+def has_path_sum_iterative(root, target):
+    stack = [(root, target)] if root else []    # (node, sum still needed)
+    while stack:
+        node, remaining = stack.pop()
+        remaining -= node.val
+        if not node.left and not node.right:
+            if remaining == 0: return True
+            continue
+        if node.right: stack.append((node.right, remaining))
+        if node.left: stack.append((node.left, remaining))
+    return False
+
 # ------------------------
 # 🔁 LOWEST COMMON ANCESTOR (LCA)
 # ------------------------
@@ -164,6 +309,26 @@ def lowest_common_ancestor(root, p, q):
     right = lowest_common_ancestor(root.right, p, q)
     return root if left and right else left or right
 
+# iterative: record parents until both p and q are seen, then climb
+def lowest_common_ancestor_iterative(root, p, q):
+    if not root: return None
+    parent = {root: None}
+    stack = [root]
+    while p not in parent or q not in parent:
+        if not stack: return None           # p or q not in the tree
+        node = stack.pop()
+        for child in (node.left, node.right):
+            if child:
+                parent[child] = node
+                stack.append(child)
+    ancestors = set()
+    while p:
+        ancestors.add(p)                    # p and everything above it
+        p = parent[p]
+    while q not in ancestors:
+        q = parent[q]                       # first shared ancestor
+    return q
+
 # ------------------------
 # 🔁 SERIALIZE / DESERIALIZE TREE
 # ------------------------
@@ -192,37 +357,91 @@ def deserialize(data):
         return node
     return dfs()
 
+# same token format, explicit stacks instead of recursion
+def serialize_iterative(root):
+    vals = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if not node:
+            vals.append('#')
+            continue
+        vals.append(str(node.val))
+        stack.append(node.right)            # right pushed first → left comes out first
+        stack.append(node.left)
+    return ' '.join(vals)
+
+def deserialize_iterative(data):
+    vals = iter(data.split())
+    val = next(vals)
+    if val == '#': return None
+    root = TreeNode(int(val))
+    stack = [[root, False]]                 # [node, left slot already filled?]
+    for val in vals:
+        slot = stack[-1]
+        child = None if val == '#' else TreeNode(int(val))
+        if not slot[1]:
+            slot[0].left = child
+            slot[1] = True
+        else:
+            slot[0].right = child
+            stack.pop()                     # both children placed
+        if child:
+            stack.append([child, False])    # fill its subtree next (preorder)
+    return root
+
 # ------------------------
 # 🔁 BINARY SEARCH TREE (BST) OPS
 # ------------------------
 
+# iterative walks: a BST op follows ONE root-to-leaf path → a loop, no call per level
+
 def search_bst(root, target):
-    if not root: return False
-    if root.val == target: return True
-    return search_bst(root.left, target) if target < root.val else search_bst(root.right, target)
+    while root and root.val != target:
+        root = root.left if target < root.val else root.right
+    return root is not None
 
 def insert_bst(root, val):
-    if not root: return TreeNode(val)
-    if val < root.val:
-        root.left = insert_bst(root.left, val)
-    else:
-        root.right = insert_bst(root.right, val)
-    return root
+    node = TreeNode(val)
+    if not root: return node
+    cur = root
+    while True:
+        if val < cur.val:
+            if not cur.left:
+                cur.left = node            # link once at the empty slot
+                return root
+            cur = cur.left
+        else:
+            if not cur.right:
+                cur.right = node
+                return root
+            cur = cur.right
 
 def delete_node(root, key):
-    if not root: return None
-    if key < root.val:
-        root.left = delete_node(root.left, key)
-    elif key > root.val:
-        root.right = delete_node(root.right, key)
+    parent, cur = None, root
+    while cur and cur.val != key:          # find node + its parent
+        parent = cur
+        cur = cur.left if key < cur.val else cur.right
+    if not cur: return root                # key not in tree
+
+    if cur.left and cur.right:
+        # two children: copy in-order successor (min of right subtree), unlink it
+        succ_parent, succ = cur, cur.right
+        while succ.left:
+            succ_parent, succ = succ, succ.left
+        cur.val = succ.val
+        if succ_parent is cur:
+            succ_parent.right = succ.right
+        else:
+            succ_parent.left = succ.right  # succ has no left child
+        return root
+
+    child = cur.left or cur.right          # 0 or 1 child → splice it in
+    if not parent: return child            # deleted the root
+    if parent.left is cur:
+        parent.left = child
     else:
-        if not root.left: return root.right
-        if not root.right: return root.left
-        temp = root.right
-        while temp.left:
-            temp = temp.left
-        root.val = temp.val
-        root.right = delete_node(root.right, temp.val)
+        parent.right = child
     return root
 
 # ------------------------
@@ -252,6 +471,7 @@ def tree_to_list(root):
 # - must check for None before accessing .left/.right
 # - recursion returns: value vs side-effect (use nonlocal if needed)
 # - incorrect base case = stack overflow
+# - recursion depth ~1000 → skewed trees need the _iterative versions
 # - BFS = use deque
 # - BST delete edge cases require finding in-order successor
 # - forget to update .left/.right = lost subtree
@@ -285,8 +505,8 @@ def tree_to_list(root):
 # ⏱ TIME COMPLEXITY
 # ------------------------
 
-# traversal:          O(n)
-# depth / diameter:   O(n)
+# traversal:          O(n) (O(h) stack; Morris: O(1) extra)
+# depth / diameter:   O(n) (tree_stats: all three in one pass)
 # BST insert/search:  O(log n) avg, O(n) worst
 # serialize/parse:    O(n)
 # LCA:                O(n)
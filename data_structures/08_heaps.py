@@ -75,6 +75,28 @@ heapq.heappush(task_heap, (2, next(counter), 'task A'))
 heapq.heappush(task_heap, (2, next(counter), 'task B'))
 # avoids compare error if objects are non-comparable
 
+# int priorities → pack (priority, seq) into ONE int: priority << 32 | seq
+# heap holds plain ints (no tuple per push, int compare instead of tuple compare)
+# payloads live in a side list indexed by seq
+class PackedPQ:
+    def __init__(self):
+        self.heap = []
+        self.payloads = []
+
+    def push(self, prio, obj):
+        heapq.heappush(self.heap, prio << 32 | len(self.payloads))
+        self.payloads.append(obj)
+
+    def pop(self):
+        key = heapq.heappop(self.heap)
+        return key >> 32, self.payloads[key & 0xFFFFFFFF]   # (priority, obj)
+
+    def __len__(self):
+        return len(self.heap)
+
+# ⚠️ seq < 2**32 and payloads are never freed → one PackedPQ per run (e.g. per Dijkstra call)
+# (negative priorities still work: >> and & recover them since Python ints are unbounded)
+
 # ------------------------
 # 🔁 HEAP SORT
 # ------------------------
@@ -84,13 +106,40 @@ def heap_sort(arr):
     return [heapq.heappop(arr) for _ in range(len(arr))]
 
 # ------------------------
-# 🛠 MANUAL MIN-HEAP CLASS
+# 🧱 HEAP CLASSES (BACKED BY heapq)
 # ------------------------
 
+# thin wrappers: every push/pop runs in heapq's C code
 class MinHeap:
     def __init__(self):
         self.heap = []
 
+    def push(self, val):
+        heapq.heappush(self.heap, val)
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+# negate once on the way in/out → the heap itself stays a plain C min-heap
+class MaxHeap:
+    def __init__(self):
+        self.heap = []
+
+    def push(self, val):
+        heapq.heappush(self.heap, -val)
+
+    def pop(self):
+        return -heapq.heappop(self.heap)
+
+# ------------------------
+# 🛠 MANUAL MIN-HEAP CLASS
+# ------------------------
+
+# same interface written out by hand (how heapq works inside)
+class ManualMinHeap:
+    def __init__(self):
+        self.heap = []
+
     def push(self, val):
         self.heap.append(val)
         self._bubble_up(len(self.heap) - 1)
@@ -103,29 +152,36 @@ class MinHeap:
         self._bubble_down(0)
         return out
 
+    # both sifts move a "hole" instead of swapping: the moving item is held in
+    # a local and written once at the end → one store per level, not a swap
+    # (same trick CPython's heapq uses)
     def _bubble_up(self, i):
+        heap = self.heap
+        item = heap[i]
         while i > 0:
-            parent = (i - 1) // 2
-            if self.heap[i] < self.heap[parent]:
-                self.heap[i], self.heap[parent] = self.heap[parent], self.heap[i]
+            parent = (i - 1) >> 1
+            if item < heap[parent]:
+                heap[i] = heap[parent]   # pull parent down into the hole
                 i = parent
             else:
                 break
+        heap[i] = item
 
     def _bubble_down(self, i):
-        n = len(self.heap)
-        while 2 * i + 1 < n:
-            left = 2 * i + 1
-            right = 2 * i + 2
-            smallest = i
-            if self.heap[left] < self.heap[smallest]:
-                smallest = left
-            if right < n and self.heap[right] < self.heap[smallest]:
-                smallest = right
-            if smallest == i:
+        heap = self.heap
+        n = len(heap)
+        item = heap[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right            # smaller of the two children
+            if not heap[child] < item:
                 break
-            self.heap[i], self.heap[smallest] = self.heap[smallest], self.heap[i]
-            i = smallest
+            heap[i] = heap[child]        # pull child up into the hole
+            i = child
+            child = 2 * i + 1
+        heap[i] = item
 
 # ------------------------
 # ⚠️ GOTCHAS
@@ -168,4 +224,5 @@ class MinHeap:
 # push/pop:         O(log n)
 # peek (min/max):   O(1)
 # heap sort:        O(n log n)
+# PackedPQ push/pop: O(log n), int compares only
 # nlargest/nsmallest: O(n log k)
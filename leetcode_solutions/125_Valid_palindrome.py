@@ -1,9 +1,32 @@
+# ASCII punctuation/whitespace → None: translate() deletes them in one C pass
+_DEL = dict.fromkeys(i for i in range(128) if not chr(i).isalnum())
+
+
 class Solution:
     def isPalindrome(self, s: str) -> bool:
-        cleaned = ""
+        if s.isascii():
+            cleaned = s.translate(_DEL).lower()   # filter + lowercase, no Python loop
+        else:
+            cleaned = "".join(filter(str.isalnum, s)).lower()  # Unicode punctuation (« » …) too
+        return cleaned == cleaned[::-1]
+
+    def isPalindromeTwoPointer(self, s: str) -> bool:
+        # two pointers from both ends: no cleaned copy, O(1) extra memory
+        i, j = 0, len(s) - 1
+        ascii_only = s.isascii()
+
+        while i < j:
+            while i < j and not s[i].isalnum():
+                i += 1
+            while i < j and not s[j].isalnum():
+                j -= 1
+            # ASCII: setting bit 0x20 lowercases letters and leaves digits alone
+            if ascii_only:
+                if ord(s[i]) | 0x20 != ord(s[j]) | 0x20:
+                    return False
+            elif s[i].lower() != s[j].lower(): #other scripts: the bit trick doesn't hold
+                return False
+            i += 1
+            j -= 1
 
-        for a in s:
-            if a.isalnum():
-                cleaned += a.lower()
-        
-        return cleaned == cleaned[::-1]
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -1,27 +1,29 @@
 class MinStack:
 # O(1) time.
+# one stack of (val, min so far) pairs: no second stack to keep in sync on pop
     def __init__(self):
         self.stack = []
-        self.stack2 = []
         
 
     def push(self, val: int) -> None:
-        self.stack.append(val)
-        if not self.stack2 or (val <= self.stack2[-1]):
-            self.stack2.append(val)
+        if self.stack:
+            cur_min = self.stack[-1][1]
+            if val < cur_min:
+                cur_min = val
+        else:
+            cur_min = val
+        self.stack.append((val, cur_min))
             
 
 
     def pop(self) -> None:
-        if self.stack[-1] == self.stack2[-1]:
-            self.stack2.pop()
-
-        self.stack.pop()
+        if self.stack:                # popping an empty stack is a no-op
+            self.stack.pop()
         
 
     def top(self) -> int:
-        return self.stack[-1]
+        return self.stack[-1][0]
 
     def getMin(self) -> int:
-        return self.stack2[-1]
+        return self.stack[-1][1]
         
@@ -1,14 +1,26 @@
+_PAIR = {')': '(', ']': '[', '}': '{'} #closer -> the opener it must match
+_OPEN = frozenset('([{') #O(1) membership, unlike scanning dit.values()
+_BYTE_CODE = bytes(1 + '([{)]}'.find(chr(b)) for b in range(256)) #byte -> 1..3 opener, 4..6 matching closer
+
+
 class Solution:
     def isValid(self, s: str) -> bool:
-        stack = [] 
-        dit = {')':'(', ']':'[', '}':'{'} 
-        for char in s: #for each character in the string
-            if char in dit.values(): #if the character is an opener
+        stack = []
+        for char in s: #for each character in the string (only brackets per the problem)
+            if char in _OPEN: #if the character is an opener
                 stack.append(char) #add it to stack of stuff to fix
-            
-            elif char in dit: #if its a closer
-                if not stack or stack[-1] != dit[char]: #If the stack is empty, or the current closer doesnt map to the most recent opener on the stack according to the dictionary
-                    return False #its automatically false
-            
-                stack.pop() #otherwise, match the closer to the opener and remove it from the stack
-        return not stack #if the stack is empty, this means that match was found for everything. Return True. Otherwise return false.
\ No newline at end of file
+            elif not stack or stack.pop() != _PAIR.get(char): #closer: pop and compare in one step, empty stack = nothing to match
+                return False #its automatically false
+        return not stack #if the stack is empty, this means that match was found for everything. Return True. Otherwise return false.
+
+    def isValidBytes(self, s: str) -> bool:
+        # encode once and translate every byte to its code in C, then loop over small ints
+        # (no 1-char str objects, no dict lookups per character)
+        stack = []
+        push, pop = stack.append, stack.pop
+        for code in s.encode().translate(_BYTE_CODE):
+            if code < 4: #opener
+                push(code)
+            elif not stack or pop() != code - 3: #closer code - 3 = its opener code
+                return False
+        return not stack
\ No newline at end of file
@@ -1,16 +1,42 @@
 class Solution:
+    # length-prefix framing: "<len>#<str>" per string → any characters (even '#')
+    # round-trip, and [] / [""] need no special tokens
     def encode(self, strs: list[str]) -> str:
-        if strs == [""]:
-            return "<EMPTY_STRING_LIST>"  # special token
-        if strs == []:
-            return "<EMPTY_LIST>"
-        delimiter = "(*&^%$#@!|:L"
-        return delimiter.join(strs)
+        parts = []
+        for x in strs:
+            parts.append(str(len(x)))
+            parts.append("#")
+            parts.append(x)
+        return "".join(parts)
 
     def decode(self, s: str) -> list[str]:
-        if s == "<EMPTY_STRING_LIST>":
-            return [""]
-        if s == "<EMPTY_LIST>":
-            return []
-        delimiter = "(*&^%$#@!|:L"
-        return s.split(delimiter)
\ No newline at end of file
+        out = []
+        i = 0
+        while i < len(s):
+            j = s.index("#", i)          # end of the length header
+            n = int(s[i:j])
+            out.append(s[j + 1:j + 1 + n])
+            i = j + 1 + n                # jump straight past the payload, no scanning it
+        return out
+
+    # same framing over UTF-8 bytes (what you'd put on a socket/file): the length
+    # counts bytes, so non-ASCII text still frames correctly. the length prefix still
+    # gives O(1) framing per string and needs no escaping; the bytearray isn't faster
+    # than the str version in CPython, pick it for the wire format
+    def encodeBytes(self, strs: list[str]) -> bytes:
+        buf = bytearray()
+        for x in strs:
+            e = x.encode("utf-8")
+            buf += b"%d#" % len(e)
+            buf += e
+        return bytes(buf)
+
+    def decodeBytes(self, b: bytes) -> list[str]:
+        out = []
+        i = 0
+        while i < len(b):
+            j = b.index(b"#", i)
+            n = int(b[i:j])
+            out.append(b[j + 1:j + 1 + n].decode("utf-8"))
+            i = j + 1 + n
+        return out
\ No newline at end of file
@@ -1,18 +1,25 @@
+from collections import Counter
+from heapq import nlargest
+
+
 class Solution:
     def topKFrequent(self, nums: list[int], k: int) -> list[int]:
-        the = {}
+        the = Counter(nums)     # counting loop runs in C
 
-        for num in nums:
-            the[num] = the.get(num, 0) + 1
-
-        sorte = sorted(the.items(), key=lambda x: x[1], reverse=True)
+        # bucket sort: a frequency is at most len(nums) → buckets[f] = values seen f times
+        buckets = [[] for _ in range(len(nums) + 1)]
+        for num, freq in the.items():
+            buckets[freq].append(num)
 
         top_k = []
-        counter = 0
-        for key, value in sorte:
-            if counter == k:
-                break
-            top_k.append(key)
-            counter += 1
+        for f in range(len(nums), 0, -1):   # highest frequency first, O(n) total
+            top_k.extend(buckets[f])
+            if len(top_k) >= k:
+                return top_k[:k]
+        return top_k
+
+    def topKFrequentHeap(self, nums: list[int], k: int) -> list[int]:
+        the = Counter(nums)
 
-        return top_k
\ No newline at end of file
+        # size-k heap over the unique values: O(u log k) instead of sorting all u
+        return nlargest(k, the, key=the.__getitem__)
\ No newline at end of file